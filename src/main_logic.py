@@ -5,18 +5,18 @@ Orchestrates the complete voice-to-text-to-paste workflow.
 
 import logging
 import threading
-import tempfile
 import os
-from pathlib import Path
-from typing import Optional, Callable
+import sys
+from typing import Optional, Callable, List
 
-import pyperclip
 import pyautogui
 
 from utils.audio_handler import Recorder
-from utils.ai_engine import WhisperEngine
-from utils.refiner import TextRefiner
-from utils.history_manager import log_to_history
+from utils.ai_engine import WhisperEngine, get_engine
+from utils.cpu_caps import pick_compute_type
+from utils.text_refiner import TextRefiner
+from utils.history_manager import HistoryManager
+from utils.clipboard_manager import copy_text, send_paste_shortcut
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -33,16 +33,21 @@ class ZukuriFlowController:
     3. Refine text using TextRefiner
     4. Log to history
     5. Copy to clipboard and paste to active window
-    6. Clean up temporary files
 
     All heavy processing runs on background threads to prevent UI blocking.
+    While recording, finished speech segments are already transcribed in the
+    background so only the tail is left when recording stops.
     """
 
+    # How often the streaming consumer looks for finished speech
+    STREAM_CHUNK_SECONDS = 5.0
+
     def __init__(
         self,
         on_status_change: Optional[Callable[[str], None]] = None,
         on_result: Optional[Callable[[str], None]] = None,
         on_error: Optional[Callable[[str], None]] = None,
+        whisper_engine: Optional[WhisperEngine] = None,
     ) -> None:
         """
         Initialize ZukuriFlowController with all required components.
@@ -51,6 +56,8 @@ class ZukuriFlowController:
             on_status_change: Callback for status updates (e.g., "Recording...", "Processing...")
             on_result: Callback when transcription is complete (receives refined text)
             on_error: Callback for error notifications
+            whisper_engine: Already loaded engine to share instead of loading
+                a second copy of the model
         """
         logger.info("Initializing ZukuriFlowController...")
 
@@ -62,10 +69,13 @@ class ZukuriFlowController:
         # Initialize components
         try:
             self._recorder = Recorder(sample_rate=16000, channels=1)
-            self._whisper = WhisperEngine(
-                model_size="base", device="cpu", compute_type="int8"
+            self._whisper = whisper_engine or get_engine(
+                model_size="distil-small.en",
+                device="cpu",
+                compute_type=pick_compute_type(),
             )
             self._refiner = TextRefiner()
+            self._history = HistoryManager()
 
         except Exception as e:
             logger.error(f"Failed to initialize components: {e}")
@@ -74,7 +84,17 @@ class ZukuriFlowController:
         # State
         self._is_processing = False
         self._processing_thread: Optional[threading.Thread] = None
-        self._temp_file: Optional[str] = None
+
+        # Streaming transcription while recording (consumer thread state)
+        self._stream_thread: Optional[threading.Thread] = None
+        self._stream_stop = threading.Event()
+        self._stream_offset = 0
+        self._stream_parts: List[str] = []
+
+        # Paste shortcut: Cmd+V on macOS, Ctrl+V elsewhere (resolved once)
+        self._paste_keys = (
+            ("command", "v") if sys.platform == "darwin" else ("ctrl", "v")
+        )
 
         logger.info("✅ ZukuriFlowController ready")
 
@@ -112,6 +132,7 @@ class ZukuriFlowController:
 
         try:
             self._recorder.start_recording()
+            self._start_streaming()
             self._notify_status("🔴 Recording...")
             return True
 
@@ -139,6 +160,48 @@ class ZukuriFlowController:
         )
         self._processing_thread.start()
 
+    def _start_streaming(self) -> None:
+        """Start the consumer that transcribes finished speech while recording."""
+        self._stream_stop.clear()
+        self._stream_offset = 0
+        self._stream_parts = []
+        self._stream_thread = threading.Thread(
+            target=self._stream_consumer, daemon=True
+        )
+        self._stream_thread.start()
+
+    def _stream_consumer(self) -> None:
+        """
+        Consumer side of the recorder -> whisper pipeline.
+
+        Every STREAM_CHUNK_SECONDS it takes the audio captured since the last
+        cut, transcribes everything up to the last finished speech segment and
+        advances the cut, overlapping transcription with recording.
+        """
+        while not self._stream_stop.wait(self.STREAM_CHUNK_SECONDS):
+            try:
+                pending = self._recorder.peek_audio(self._stream_offset)
+                cut = self._whisper.find_final_boundary(pending)
+                if not cut:
+                    continue
+
+                text = self._whisper.transcribe_ndarray(pending[:cut])
+                if text:
+                    self._stream_parts.append(text)
+                self._stream_offset += cut
+
+            except Exception as e:
+                # Whatever is left is transcribed as the tail on stop
+                logger.warning(f"Streaming transcription failed: {e}")
+                return
+
+    def _finish_streaming(self) -> None:
+        """Stop the streaming consumer and wait for its in-flight chunk."""
+        self._stream_stop.set()
+        if self._stream_thread:
+            self._stream_thread.join()
+            self._stream_thread = None
+
     def _process_voice_workflow(self) -> None:
         """
         Internal method that runs the complete voice processing workflow.
@@ -146,24 +209,21 @@ class ZukuriFlowController:
         Runs on a background thread to prevent UI blocking.
         """
         self._is_processing = True
-        temp_file = None
 
         try:
-            # Step 1: Stop recording and save to temp file
-            self._notify_status("⏹️ Saving audio...")
-
-            # Create temp file path
-            temp_dir = Path(tempfile.gettempdir()) / "zukuriflow"
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            temp_file = str(temp_dir / "recording.wav")
+            # Step 1: Stop recording and keep the audio in memory
+            self._notify_status("⏹️ Stopping recording...")
+            self._finish_streaming()
+            audio = self._recorder.stop_recording_ndarray()
 
-            # Stop recording and save
-            saved_path = self._recorder.stop_recording(temp_file)
-            self._temp_file = saved_path
-
-            # Step 2: Transcribe audio
+            # Step 2: Transcribe the tail not yet covered by the stream
             self._notify_status("🧠 Transcribing...")
-            raw_text = self._whisper.transcribe_audio(saved_path)
+            offset = self._stream_offset
+            tail = audio[offset:]
+            parts = list(self._stream_parts)
+            if len(tail):
+                parts.append(self._whisper.transcribe_ndarray(tail))
+            raw_text = " ".join(part for part in parts if part)
 
             if not raw_text.strip():
                 self._notify_error("No speech detected in recording")
@@ -179,7 +239,7 @@ class ZukuriFlowController:
 
             # Step 4: Log to history
             self._notify_status("💾 Saving to history...")
-            log_to_history(refined_text)
+            self._history.log(refined_text)
 
             # Step 5: Copy to clipboard and paste
             self._notify_status("📋 Pasting...")
@@ -189,9 +249,6 @@ class ZukuriFlowController:
             self._notify_status("✅ Done!")
             self._notify_result(refined_text)
 
-        except FileNotFoundError as e:
-            self._notify_error(f"Audio file error: {e}")
-
         except RuntimeError as e:
             self._notify_error(f"Processing error: {e}")
 
@@ -199,8 +256,6 @@ class ZukuriFlowController:
             self._notify_error(f"Unexpected error: {e}")
 
         finally:
-            # Cleanup: Delete temporary WAV file
-            self._cleanup_temp_file(temp_file)
             self._is_processing = False
 
     def process_voice(self, audio_file: str) -> Optional[str]:
@@ -230,7 +285,7 @@ class ZukuriFlowController:
 
             # Step 3: Log to history
             logger.info("Logging to history...")
-            log_to_history(refined_text)
+            self._history.log(refined_text)
 
             # Step 4: Copy to clipboard and paste
             logger.info("Copying and pasting...")
@@ -249,28 +304,28 @@ class ZukuriFlowController:
         """
         Copy text to clipboard and paste to active window.
 
-        Uses pyperclip for clipboard and pyautogui for paste shortcut.
+        Uses the OS-native clipboard and paste shortcut, falling back to
+        pyperclip/pyautogui when no native backend is available.
 
         Args:
             text: Text to copy and paste
         """
         try:
             # Copy to clipboard
-            pyperclip.copy(text)
+            copy_text(text)
             logger.info(f"Copied to clipboard: {text[:50]}...")
 
+            # Native key injection, no settle delay needed
+            if send_paste_shortcut():
+                logger.info(f"Pasted using {'+'.join(self._paste_keys)} (native)")
+                return
+
             # Small delay to ensure clipboard is ready
             pyautogui.sleep(0.1)
 
             # Paste using Ctrl+V (Windows/Linux) or Cmd+V (macOS)
-            import platform
-
-            if platform.system() == "Darwin":
-                pyautogui.hotkey("command", "v")
-                logger.info("Pasted using Cmd+V (macOS)")
-            else:
-                pyautogui.hotkey("ctrl", "v")
-                logger.info("Pasted using Ctrl+V")
+            pyautogui.hotkey(*self._paste_keys)
+            logger.info(f"Pasted using {'+'.join(self._paste_keys)}")
 
         except Exception as e:
             logger.error(f"Copy/paste failed: {e}")
@@ -307,15 +362,18 @@ class ZukuriFlowController:
 
 
 # Convenience function for simple usage
-def quick_process(audio_file: str) -> Optional[str]:
+def quick_process(
+    audio_file: str, whisper_engine: Optional[WhisperEngine] = None
+) -> Optional[str]:
     """
     Quick one-shot processing of an audio file.
 
     Args:
         audio_file: Path to the audio file
+        whisper_engine: Optional loaded engine to reuse
 
     Returns:
         str: Refined text, or None if failed
     """
-    controller = ZukuriFlowController()
+    controller = ZukuriFlowController(whisper_engine=whisper_engine)
     return controller.process_voice(audio_file)
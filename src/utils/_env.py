@@ -0,0 +1,39 @@
+"""
+Process-wide threading setup for CTranslate2 / faster-whisper.
+
+OpenMP and MKL read their thread settings once, when the library loads, so
+this module must be imported before ctranslate2 or faster_whisper.
+"""
+
+import os
+
+
+def physical_cpu_count() -> int:
+    """
+    Count physical CPU cores for CTranslate2's intra-op thread pool.
+
+    More threads than physical cores makes the int8 GEMM kernels fight over
+    shared execution units. Uses psutil when installed, otherwise assumes two
+    hardware threads per core.
+
+    Returns:
+        Number of physical cores (at least 1)
+    """
+    try:
+        import psutil
+
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        cores = None
+
+    return max(1, cores or (os.cpu_count() or 2) // 2)
+
+
+# Respect anything the user already exported (OMP_NUM_THREADS is the knob for
+# benchmarking other thread counts); MKL follows OpenMP unless set separately
+os.environ.setdefault("OMP_NUM_THREADS", str(physical_cpu_count()))
+os.environ.setdefault("MKL_NUM_THREADS", os.environ["OMP_NUM_THREADS"])
+os.environ.setdefault("KMP_AFFINITY", "granularity=fine,compact,1,0")
+
+# Thread count to pass to WhisperModel(cpu_threads=...)
+CPU_THREADS = int(os.environ["OMP_NUM_THREADS"])
@@ -3,11 +3,24 @@ WhisperEngine - High-Performance Transcription with Faster-Whisper
 Optimized for technical vocabulary with initial prompt and VAD filtering.
 """
 
+import functools
+import io
 import logging
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
-from faster_whisper import WhisperModel
+import numpy as np
+
+from ._env import CPU_THREADS  # Must run before faster_whisper is imported
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.audio import decode_audio
+from faster_whisper.vad import SpeechTimestampsMap, VadOptions, get_speech_timestamps
+
+from .whisper_engine import (
+    WhisperEngine as _StreamingEngine,
+    pack_clip_windows,
+    resolve_compute_type,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -19,7 +32,7 @@ class WhisperEngine:
     High-performance speech-to-text engine using Faster-Whisper.
 
     Features:
-    - Base model with int8 quantization for CPU efficiency
+    - Distil-Whisper model with int8 quantization for CPU efficiency
     - Initial prompt with technical keywords for improved accuracy
     - VAD (Voice Activity Detection) for automatic silence removal
     """
@@ -29,17 +42,37 @@ class WhisperEngine:
         "ZukuriFlow, SDE, Python, LangGraph, Next.js, SQL, RAG, Internshala"
     )
 
+    # Per-word timing record used by transcribe_with_timestamps_soa
+    WORD_TIMING_DTYPE = np.dtype(
+        [("start", np.float32), ("end", np.float32), ("probability", np.float32)]
+    )
+
+    # Audio longer than one Whisper window goes through the batched pipeline
+    BATCHED_MIN_SECONDS: float = 30.0
+
     def __init__(
-        self, model_size: str = "base", device: str = "cpu", compute_type: str = "int8"
+        self,
+        model_size: str = "distil-small.en",
+        device: str = "cpu",
+        compute_type: str = "auto",
+        cpu_threads: int = CPU_THREADS,
+        num_workers: int = 1,
     ) -> None:
         """
         Initialize WhisperEngine with optimized settings.
 
         Args:
-            model_size: Model size - 'base' recommended for balance
+            model_size: Model size - 'distil-small.en' recommended for English dictation
             device: Compute device - 'cpu' or 'cuda'
-            compute_type: Quantization type - 'int8' for maximum CPU efficiency
+            compute_type: Quantization type - 'auto' lets CTranslate2 pick the fastest
+                type for the device; CPU users should pass 'int8' explicitly.
+                'int8' is upgraded to 'int8_float16' on CUDA.
+            cpu_threads: CTranslate2 threads per model call; defaults to the
+                physical core count
+            num_workers: Model replicas for concurrent transcribe calls
         """
+        compute_type = resolve_compute_type(device, compute_type)
+
         logger.info(
             f"Initializing WhisperEngine: model={model_size}, device={device}, compute={compute_type}"
         )
@@ -50,9 +83,17 @@ class WhisperEngine:
 
         # Initialize the Whisper model with specified settings
         self.model: WhisperModel = WhisperModel(
-            model_size, device=device, compute_type=compute_type
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
         )
 
+        # Batches VAD segments through the encoder/decoder for long audio
+        self.batched_model = BatchedInferencePipeline(model=self.model)
+        self.batch_size: int = 16 if device == "cuda" else 8
+
         # CRITICAL: Initial prompt with technical keywords to fix "wrong word" detection
         self.initial_prompt: str = (
             f"Technical transcription containing: {self.TECHNICAL_KEYWORDS}. "
@@ -61,7 +102,14 @@ class WhisperEngine:
 
         logger.info("WhisperEngine initialized successfully")
 
-    def transcribe_audio(self, file_path: str) -> str:
+    def transcribe_audio(
+        self,
+        file_path: str,
+        beam_size: int = 1,
+        language: str = "en",
+        condition_on_previous_text: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> str:
         """
         Transcribe audio file to text with VAD and technical keyword optimization.
 
@@ -73,6 +121,12 @@ class WhisperEngine:
 
         Args:
             file_path: Path to the audio file (WAV, MP3, etc.)
+            beam_size: Beam width - 1 is greedy search, the fast path on CPU
+            language: Language code; a fixed language skips the detection pass
+            condition_on_previous_text: Feed each window the previous text;
+                off by default so long files cannot drift into fallbacks
+            batch_size: Segments per batch for audio over 30s (default 8 on CPU,
+                16 on GPU)
 
         Returns:
             str: Transcribed text
@@ -89,19 +143,172 @@ class WhisperEngine:
 
         logger.info(f"Transcribing audio: {file_path}")
 
+        # Decode once up front so the duration picks the pipeline
+        return self._transcribe(
+            decode_audio(str(audio_path)),
+            beam_size,
+            language,
+            condition_on_previous_text,
+            batch_size,
+        )
+
+    def transcribe_ndarray(
+        self,
+        audio: np.ndarray,
+        sample_rate: int = 16000,
+        beam_size: int = 1,
+        language: str = "en",
+        condition_on_previous_text: bool = False,
+    ) -> str:
+        """
+        Transcribe in-memory audio without writing or decoding a WAV file.
+
+        Args:
+            audio: Mono float32 samples in [-1, 1]
+            sample_rate: Sample rate of ``audio``; Whisper requires 16000Hz
+            beam_size: Beam width - 1 is greedy search, the fast path on CPU
+            language: Language code; a fixed language skips the detection pass
+            condition_on_previous_text: Feed each window the previous text
+
+        Returns:
+            str: Transcribed text
+
+        Raises:
+            ValueError: If the audio is not 16000Hz mono float32
+            Exception: If transcription fails
+        """
+        # faster-whisper would silently misread any other layout
+        if sample_rate != 16000:
+            raise ValueError(f"Expected 16000Hz audio, got {sample_rate}Hz")
+        if audio.ndim != 1:
+            raise ValueError(f"Expected mono audio, got shape {audio.shape}")
+        if audio.dtype != np.float32:
+            raise ValueError(f"Expected float32 samples, got {audio.dtype}")
+
+        logger.info(f"Transcribing {len(audio) / 16000:.1f}s of in-memory audio")
+
+        return self._transcribe(audio, beam_size, language, condition_on_previous_text)
+
+    def find_final_boundary(self, audio: np.ndarray, min_silence_s: float = 0.5) -> int:
+        """
+        Find how much of a still-growing recording can be transcribed already.
+
+        Uses Silero VAD so a chunk always ends after a finished speech segment
+        and never cuts through a word.
+
+        Args:
+            audio: Mono float32 samples at 16000Hz captured so far
+            min_silence_s: Silence required after a segment before it is final
+
+        Returns:
+            int: Sample index up to which the audio is final (0 if none yet)
+        """
+        settled = len(audio) - int(min_silence_s * 16000)
+        if settled <= 0:
+            return 0
+
+        # Same VAD settings as the streaming engine, with the caller's silence
+        options = VadOptions(
+            **dict(
+                _StreamingEngine.VAD_PARAMETERS,
+                min_silence_duration_ms=int(min_silence_s * 1000),
+            )
+        )
+        speech = get_speech_timestamps(audio, vad_options=options)
+        if not speech:
+            # Only silence so far: all of it up to the tail can be dropped
+            return settled
+
+        final_ends = [s["end"] for s in speech if s["end"] <= settled]
+        return final_ends[-1] if final_ends else 0
+
+    def _extract_speech(self, audio: np.ndarray) -> Tuple[np.ndarray, List[Dict]]:
+        """
+        Cut silence out of the audio with Silero VAD before it reaches Whisper.
+
+        Only speech goes through the encoder, so silent stretches cost nothing
+        regardless of where they fall relative to Whisper's 30s windows.
+
+        Args:
+            audio: Mono float32 samples at 16000Hz
+
+        Returns:
+            Tuple of the concatenated speech samples and the speech segments
+            (sample offsets) needed to map times back to the original audio
+        """
+        speech = get_speech_timestamps(audio)
+        if not speech:
+            return np.empty(0, dtype=np.float32), speech
+
+        chunks = [audio[slice(s["start"], s["end"])] for s in speech]
+        return np.concatenate(chunks), speech
+
+    def _transcribe(
+        self,
+        audio: np.ndarray,
+        beam_size: int,
+        language: str,
+        condition_on_previous_text: bool,
+        batch_size: Optional[int] = None,
+    ) -> str:
+        """
+        Run the model on a sample array and join the segments.
+
+        Clips up to BATCHED_MIN_SECONDS use the sequential model, where
+        per-batch overhead would dominate; longer audio is batched.
+
+        Args:
+            audio: Mono float32 samples at 16000Hz
+            beam_size: Beam width (1 = greedy)
+            language: Language code, skips language detection
+            condition_on_previous_text: Feed each window the previous text
+            batch_size: Segments per batch on the batched path
+
+        Returns:
+            str: Transcribed text
+        """
         try:
-            # Use this specific parameter to fix wrong word detection
-            segments, info = self.model.transcribe(
-                str(audio_path),
-                # Context-aware words
+            # Auto-detect and remove silence up front
+            audio, speech = self._extract_speech(audio)
+            if not len(audio):
+                logger.info("No speech detected, skipping transcription")
+                return ""
+
+            options = dict(
+                # Use this specific parameter to fix wrong word detection
                 initial_prompt="ZukuriFlow, SDE, Python, LangGraph, Next.js, SQL, RAG, Internshala",
-                vad_filter=True,  # Auto-detect and remove silence
-                beam_size=5,  # Balanced speed and accuracy
+                vad_filter=False,  # Silence already removed above
+                beam_size=beam_size,  # 1 = greedy, roughly halves decoder work
+                language=language,  # Known language, no detection pass
+                temperature=0.0,  # No temperature fallback re-decodes
+                condition_on_previous_text=condition_on_previous_text,
             )
 
-            # Combine all segments into final text
-            transcription = " ".join([segment.text.strip() for segment in segments])
-
+            if len(audio) / 16000 > self.BATCHED_MIN_SECONDS:
+                segments, info = self.batched_model.transcribe(
+                    audio,
+                    batch_size=batch_size or self.batch_size,
+                    clip_timestamps=pack_clip_windows(speech),
+                    **options,
+                )
+            else:
+                segments, info = self.model.transcribe(audio, **options)
+
+            # Combine segments as they are decoded, in a single pass
+            buffer = io.StringIO()
+            for segment in segments:
+                text = segment.text
+                # Only pay for strip() when the text has whitespace edges
+                if text and (text[0].isspace() or text[-1].isspace()):
+                    text = text.strip()
+                if not text:
+                    continue
+                if buffer.tell():
+                    buffer.write(" ")
+                buffer.write(text)
+            transcription = buffer.getvalue()
+
+            # info is only complete once the segment generator is exhausted
             logger.info(
                 f"Detected language: {info.language} (confidence: {info.language_probability:.1%})"
             )
@@ -113,15 +320,80 @@ class WhisperEngine:
             logger.error(f"Transcription failed: {str(e)}")
             raise
 
-    def transcribe_with_timestamps(self, file_path: str) -> List[Dict[str, Any]]:
+    def transcribe_with_timestamps(
+        self, file_path: str, word_timestamps: bool = False
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Transcribe audio with word-level timestamps.
+        Transcribe audio with segment-level and optionally word-level timestamps.
+
+        Word alignment costs an extra cross-attention pass, so it is opt-in.
+        Segments are yielded as the model decodes them.
 
         Args:
             file_path: Path to the audio file
+            word_timestamps: Also align and return individual words
 
         Returns:
-            List of segments with start, end times and text
+            Iterator of segments with start, end times and text (plus "words"
+            when word_timestamps is True)
+        """
+        segments, to_original = self._decode_timestamped(file_path, word_timestamps)
+        return self._timestamped_segments(segments, to_original, word_timestamps)
+
+    def transcribe_with_timestamps_soa(
+        self, file_path: str
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Transcribe with word timestamps in a structure-of-arrays layout.
+
+        Instead of one dict per word, each segment carries its words as a list
+        of strings plus one structured array of (start, end, probability), so
+        long transcripts create few objects and timings can be processed
+        vectorially (e.g. for subtitle export).
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            Iterator of segments with "start", "end", "text", "word_text" (list
+            of str) and "word_timing" (WORD_TIMING_DTYPE array, or None when the
+            segment has no words)
+        """
+        segments, to_original = self._decode_timestamped(file_path, True)
+        for segment in segments:
+            words = segment.words
+            yield {
+                "start": to_original(segment.start),
+                "end": to_original(segment.end),
+                "text": segment.text.strip(),
+                "word_text": [word.word for word in words] if words else [],
+                "word_timing": (
+                    np.fromiter(
+                        (
+                            (to_original(w.start), to_original(w.end), w.probability)
+                            for w in words
+                        ),
+                        dtype=self.WORD_TIMING_DTYPE,
+                        count=len(words),
+                    )
+                    if words
+                    else None
+                ),
+            }
+
+    def _decode_timestamped(
+        self, file_path: str, word_timestamps: bool
+    ) -> Tuple[Iterable[Any], Callable[[float], float]]:
+        """
+        Validate, strip silence and start decoding a file with timestamps.
+
+        Args:
+            file_path: Path to the audio file
+            word_timestamps: Also align individual words
+
+        Returns:
+            Tuple of the lazy segment iterator and a function mapping times on
+            the speech-only timeline back onto the file's timeline
         """
         audio_path = Path(file_path)
         if not audio_path.exists():
@@ -129,35 +401,71 @@ class WhisperEngine:
 
         logger.info(f"Transcribing with timestamps: {file_path}")
 
+        audio, speech = self._extract_speech(decode_audio(str(audio_path)))
+        if not len(audio):
+            logger.info("No speech detected, skipping transcription")
+            return (), float
+
         segments, info = self.model.transcribe(
-            str(audio_path),
+            audio,
             language="en",
             initial_prompt=self.initial_prompt,
-            vad_filter=True,
-            word_timestamps=True,
+            vad_filter=False,
+            word_timestamps=word_timestamps,
+            beam_size=1,
+            temperature=0.0,
+            condition_on_previous_text=False,
         )
 
-        result: List[Dict[str, Any]] = []
+        # Times come back on the speech-only timeline; map them to the file's
+        timeline = SpeechTimestampsMap(speech, 16000)
+        return segments, timeline.get_original_time
+
+    @staticmethod
+    def _timestamped_segments(
+        segments: Iterable[Any],
+        to_original: Callable[[float], float],
+        word_timestamps: bool,
+    ) -> Iterator[Dict[str, Any]]:
+        """Convert faster-whisper segments to dicts on the original timeline."""
+        count = 0
         for segment in segments:
-            result.append(
-                {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip(),
-                    "words": [
+            result: Dict[str, Any] = {
+                "start": to_original(segment.start),
+                "end": to_original(segment.end),
+                "text": segment.text.strip(),
+            }
+            if word_timestamps:
+                words = segment.words
+                result["words"] = (
+                    [
                         {
                             "word": word.word,
-                            "start": word.start,
-                            "end": word.end,
+                            "start": to_original(word.start),
+                            "end": to_original(word.end),
                             "probability": word.probability,
                         }
-                        for word in (segment.words or [])
-                    ],
-                }
-            )
+                        for word in words
+                    ]
+                    if words
+                    else []
+                )
+            count += 1
+            yield result
+
+        logger.info(f"Extracted {count} segments with timestamps")
+
+    def warmup(self) -> None:
+        """
+        Run one second of silence through the model.
 
-        logger.info(f"Extracted {len(result)} segments with timestamps")
-        return result
+        Initializes CTranslate2's kernels and thread pool so the first real
+        request does not pay for it.
+        """
+        segments, _ = self.model.transcribe(
+            np.zeros(16000, dtype=np.float32), language="en", beam_size=1
+        )
+        list(segments)  # Segments are lazy; consume to actually decode
 
     def get_model_info(self) -> Dict[str, str]:
         """
@@ -172,3 +480,28 @@ class WhisperEngine:
             "compute_type": self.compute_type,
             "initial_prompt": self.initial_prompt,
         }
+
+
+@functools.lru_cache(maxsize=4)
+def get_engine(
+    model_size: str = "distil-small.en", device: str = "cpu", compute_type: str = "auto"
+) -> WhisperEngine:
+    """
+    Return a loaded, warmed-up WhisperEngine shared per configuration.
+
+    Loading the model costs seconds, often more than transcribing a short
+    utterance, so callers should use this instead of constructing engines.
+
+    Args:
+        model_size: Model size passed to WhisperEngine
+        device: Compute device - 'cpu' or 'cuda'
+        compute_type: Quantization type passed to WhisperEngine
+
+    Returns:
+        WhisperEngine: Cached engine for this configuration
+    """
+    engine = WhisperEngine(
+        model_size=model_size, device=device, compute_type=compute_type
+    )
+    engine.warmup()
+    return engine
@@ -1,18 +1,21 @@
 """
-Recorder - Audio Recording Utility using sounddevice and wavio
+Recorder - Audio Recording Utility using sounddevice and wave
 Handles microphone input and WAV file storage for ZukuriFlow Elite.
 """
 
 import logging
 import threading
-from typing import Optional, List, TYPE_CHECKING
+import wave
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 
 if TYPE_CHECKING:
     import sounddevice as sd
 
 import numpy as np
-import wavio
+
+from .audio_recorder import AudioBuffer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,8 +29,9 @@ class Recorder:
     Features:
     - 16000Hz sample rate (optimal for Whisper)
     - Mono channel recording
+    - Native 16-bit capture, written to WAV without conversion
     - Thread-safe start/stop operations
-    - WAV file output using wavio
+    - 16-bit PCM WAV output using the standard library wave module
     """
 
     def __init__(self, sample_rate: int = 16000, channels: int = 1) -> None:
@@ -40,14 +44,21 @@ class Recorder:
         """
         self.sample_rate = sample_rate
         self.channels = channels
-        self.dtype = np.float32
+        # Capture 16-bit PCM natively: half the buffer size of float32 and
+        # already the WAV sample format
+        self.dtype = np.int16
 
         # Recording state
-        self._frames: List[np.ndarray] = []
+        self._buffer = AudioBuffer(sample_rate, dtype=self.dtype, channels=channels)
         self._stream: Optional["sd.InputStream"] = None
         self._is_recording: bool = False
         self._lock = threading.Lock()
 
+        # Single worker so background WAV writes land in order
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="recorder-io"
+        )
+
         # Verify microphone is available
         self._check_microphone()
 
@@ -82,7 +93,7 @@ class Recorder:
         self, indata: np.ndarray, frames: int, time_info, status
     ) -> None:
         """
-        Callback function for audio stream - collects frames into list.
+        Callback function for audio stream - writes frames into the buffer.
 
         Args:
             indata: Input audio data
@@ -94,13 +105,13 @@ class Recorder:
             logger.warning(f"Audio stream status: {status}")
 
         if self._is_recording:
-            self._frames.append(indata.copy())
+            self._buffer.write(indata)
 
     def start_recording(self) -> None:
         """
         Start recording audio from the microphone.
 
-        Collects audio frames into an internal list for later processing.
+        Collects audio frames into a preallocated buffer for later processing.
 
         Raises:
             RuntimeError: If recording is already in progress or microphone fails
@@ -111,8 +122,10 @@ class Recorder:
                 return
 
             try:
-                # Clear previous frames
-                self._frames = []
+                # Fresh buffer per take so a previously returned view stays valid
+                self._buffer = AudioBuffer(
+                    self.sample_rate, dtype=self.dtype, channels=self.channels
+                )
                 self._is_recording = True
 
                 import sounddevice as sd
@@ -133,6 +146,76 @@ class Recorder:
                 logger.error(f"Failed to start recording: {e}")
                 raise RuntimeError(f"Could not start recording: {e}")
 
+    def _stop_stream(self) -> None:
+        """
+        Stop the input stream and check that frames were captured.
+
+        Must be called with ``self._lock`` held.
+
+        Raises:
+            RuntimeError: If no audio data was recorded
+        """
+        self._is_recording = False
+
+        if self._stream:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+        logger.info("⏹️ Recording stopped")
+
+        # Check if we have audio data
+        if not len(self._buffer):
+            raise RuntimeError("No audio data recorded")
+
+    def stop_recording_ndarray(self) -> np.ndarray:
+        """
+        Stop recording and return the audio in memory, skipping the WAV round-trip.
+
+        faster-whisper accepts a float32 mono array directly, so callers that only
+        need a transcription avoid the disk write and re-decode.
+
+        Returns:
+            np.ndarray: Mono float32 samples in [-1, 1] at ``sample_rate``
+
+        Raises:
+            RuntimeError: If no recording is in progress or no audio was captured
+        """
+        with self._lock:
+            if not self._is_recording:
+                logger.warning("No recording in progress")
+                raise RuntimeError("No recording in progress to stop")
+
+            self._stop_stream()
+
+        return self._to_mono(self._buffer.view())
+
+    def peek_audio(self, start: int = 0) -> np.ndarray:
+        """
+        Return the audio captured so far without stopping the recording.
+
+        Lets a consumer transcribe finished parts of a take while it is still
+        being recorded.
+
+        Args:
+            start: Sample offset to read from
+
+        Returns:
+            np.ndarray: Mono float32 samples from ``start`` to the current end
+        """
+        # The audio callback keeps writing past the end of this view
+        return self._to_mono(self._buffer.view()[start:])
+
+    @staticmethod
+    def _to_mono(audio_data: np.ndarray) -> np.ndarray:
+        """Downmix int16 samples to the 1-D float32 [-1, 1] signal Whisper expects."""
+        if audio_data.ndim > 1:
+            audio = audio_data.mean(axis=1, dtype=np.float32)
+        else:
+            audio = audio_data.astype(np.float32)
+        audio *= 1.0 / 32768
+        return audio
+
     def stop_recording(self, output_filename: str) -> str:
         """
         Stop recording and save audio to a WAV file.
@@ -152,54 +235,67 @@ class Recorder:
                 raise RuntimeError("No recording in progress to stop")
 
             try:
-                # Stop the stream
-                self._is_recording = False
+                self._stop_stream()
+                return self._write_wav(self._buffer.view(), output_filename)
 
-                if self._stream:
-                    self._stream.stop()
-                    self._stream.close()
-                    self._stream = None
+            except Exception as e:
+                logger.error(f"Failed to save recording: {e}")
+                raise RuntimeError(f"Could not save recording: {e}")
 
-                logger.info("⏹️ Recording stopped")
+    def stop_recording_async(self, output_filename: str) -> Tuple[str, Future]:
+        """
+        Stop recording and save the WAV file on a background I/O thread.
 
-                # Check if we have audio data
-                if not self._frames:
-                    raise RuntimeError("No audio data recorded")
+        Returns as soon as the stream is stopped, so the caller does not wait
+        for the disk write.
 
-                # Concatenate all frames
-                audio_data = np.concatenate(self._frames, axis=0)
+        Args:
+            output_filename: Path for the output WAV file
+
+        Returns:
+            Tuple of the output path and a Future that resolves to the same
+            path once the file is written (or raises if the write failed)
+
+        Raises:
+            RuntimeError: If no recording is in progress or no audio was captured
+        """
+        with self._lock:
+            if not self._is_recording:
+                logger.warning("No recording in progress")
+                raise RuntimeError("No recording in progress to stop")
 
-                # Ensure output path exists
-                output_path = Path(output_filename)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._stop_stream()
+            audio_int16 = self._buffer.view()
 
-                # Convert float32 [-1, 1] to int16 for WAV file
-                audio_int16 = np.int16(audio_data * 32767)
+        future = self._io_executor.submit(self._write_wav, audio_int16, output_filename)
+        return str(Path(output_filename)), future
 
-                # Reshape for mono output
-                if audio_int16.ndim == 1:
-                    audio_int16 = audio_int16.reshape(-1, 1)
+    def _write_wav(self, audio_int16: np.ndarray, output_filename: str) -> str:
+        """
+        Write captured 16-bit PCM samples to a WAV file.
 
-                # Save using wavio (mono .wav file)
-                wavio.write(
-                    str(output_path),
-                    audio_int16,
-                    self.sample_rate,
-                    sampwidth=2,  # 16-bit audio
-                )
+        Args:
+            audio_int16: Samples as captured, shape (frames,) or (frames, channels)
+            output_filename: Path for the output WAV file
 
-                duration = len(audio_data) / self.sample_rate
-                logger.info(f"💾 Saved {duration:.1f}s audio to: {output_path}")
+        Returns:
+            str: Path to the saved WAV file
+        """
+        # Ensure output path exists
+        output_path = Path(output_filename)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Clear frames
-                self._frames = []
+        # Captured samples are already 16-bit PCM
+        with wave.open(str(output_path), "wb") as wav_file:
+            wav_file.setnchannels(self.channels)
+            wav_file.setsampwidth(2)  # 16-bit audio
+            wav_file.setframerate(self.sample_rate)
+            wav_file.writeframes(audio_int16.tobytes())
 
-                return str(output_path)
+        duration = len(audio_int16) / self.sample_rate
+        logger.info(f"💾 Saved {duration:.1f}s audio to: {output_path}")
 
-            except Exception as e:
-                self._frames = []
-                logger.error(f"Failed to save recording: {e}")
-                raise RuntimeError(f"Could not save recording: {e}")
+        return str(output_path)
 
     def is_recording(self) -> bool:
         """Check if recording is currently active."""
@@ -212,11 +308,7 @@ class Recorder:
         Returns:
             float: Duration in seconds
         """
-        if not self._frames:
-            return 0.0
-
-        total_frames = sum(len(f) for f in self._frames)
-        return total_frames / self.sample_rate
+        return len(self._buffer) / self.sample_rate
 
     def __del__(self) -> None:
         """Cleanup resources on deletion."""
@@ -1,15 +1,84 @@
 """
-AudioRecorder - High-quality audio recording using sounddevice and wavio
+AudioRecorder - High-quality audio recording using sounddevice and wave
 """
 
 from typing import Optional
+import wave
+
 import numpy as np
-import wavio
+
+
+class AudioBuffer:
+    """
+    Preallocated, growable sample buffer for realtime capture.
+
+    The audio callback writes each block in place instead of appending a copy
+    to a list, so there is no per-callback allocation and no final concatenate.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        seconds: float = 60.0,
+        dtype: str = "float32",
+        channels: int = 1,
+    ) -> None:
+        """
+        Initialize the buffer.
+
+        Args:
+            sample_rate: Sample rate in Hz, used to size the initial capacity
+            seconds: Initial capacity in seconds of audio
+            dtype: Sample data type
+            channels: Channels to keep; 1 stores a flat mono signal
+        """
+        shape = (int(sample_rate * seconds),)
+        if channels > 1:
+            shape += (channels,)
+        self._data = np.empty(shape, dtype=dtype)
+        self._length = 0
+
+    def write(self, block: np.ndarray) -> None:
+        """
+        Append a block of samples.
+
+        A mono buffer keeps only the first channel of multi-channel blocks.
+
+        Args:
+            block: Samples shaped (frames,) or (frames, channels)
+        """
+        end = self._length + len(block)
+
+        if end > len(self._data):
+            # Double the capacity so growth stays amortized O(1) per sample
+            grown = np.empty(
+                (max(end, 2 * len(self._data)),) + self._data.shape[1:],
+                dtype=self._data.dtype,
+            )
+            grown[: self._length] = self._data[: self._length]
+            self._data = grown
+
+        if self._data.ndim == 1 and block.ndim > 1:
+            block = block[:, 0]
+
+        start = self._length
+        self._data[start:end] = block
+        self._length = end
+
+    def view(self) -> np.ndarray:
+        """Return the recorded samples as a zero-copy view."""
+        # Read the length first: if the writer grows the buffer in between,
+        # the new array holds at least this many samples
+        length = self._length
+        return self._data[:length]
+
+    def __len__(self) -> int:
+        return self._length
 
 
 class AudioRecorder:
     """
-    Professional audio recorder using sounddevice for capture and wavio for export.
+    Professional audio recorder using sounddevice for capture and wave for export.
 
     Attributes:
         sample_rate: Recording sample rate in Hz
@@ -26,7 +95,8 @@ class AudioRecorder:
         Args:
             sample_rate: Sample rate in Hz (16000 is optimal for Whisper)
             channels: Number of audio channels (1=mono, 2=stereo)
-            dtype: Data type for audio recording ('float32' recommended)
+            dtype: Data type for audio recording ('float32', or 'int16' for
+                half the memory when the consumer converts it, as WhisperEngine does)
         """
         self.sample_rate = sample_rate
         self.channels = channels
@@ -48,15 +118,19 @@ class AudioRecorder:
 
         if duration:
             print(f"🔴 Recording for {duration}s...")
-            audio_data = sd.rec(
-                int(duration * self.sample_rate),
+            # PortAudio writes straight into this buffer, no per-block copies
+            audio_data = np.empty(
+                (int(duration * self.sample_rate), self.channels), dtype=self.dtype
+            )
+            sd.rec(
                 samplerate=self.sample_rate,
                 channels=self.channels,
                 dtype=self.dtype,
+                out=audio_data,
             )
             sd.wait()  # Wait until recording is finished
             print("✅ Recording complete")
-            return audio_data.flatten()
+            return audio_data.reshape(-1)
         else:
             # For manual control, use record_streaming instead
             raise NotImplementedError("Use record_streaming for manual control")
@@ -80,18 +154,23 @@ class AudioRecorder:
             audio_data: Audio numpy array
             filename: Output file path
         """
-        # Ensure audio is in correct format
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
-
-        # Reshape for wavio if needed
-        if audio_data.ndim == 1:
-            audio_data = audio_data.reshape(-1, 1)
-
-        # Convert float32 [-1, 1] to int16 for WAV
-        audio_int16 = np.int16(audio_data * 32767)
+        if audio_data.dtype == np.int16:
+            # Captured as 16-bit PCM already
+            audio_int16 = audio_data
+        else:
+            # Scale, saturate and round to int16 in one float32 scratch array
+            # (plain truncation biases samples and wraps peaks above 1.0)
+            scaled = np.multiply(audio_data, 32767.0, dtype=np.float32)
+            np.clip(scaled, -32768.0, 32767.0, out=scaled)
+            np.rint(scaled, out=scaled)
+            audio_int16 = scaled.astype(np.int16)
+
+        with wave.open(filename, "wb") as wav_file:
+            wav_file.setnchannels(1 if audio_int16.ndim == 1 else audio_int16.shape[1])
+            wav_file.setsampwidth(2)  # 16-bit audio
+            wav_file.setframerate(self.sample_rate)
+            wav_file.writeframes(audio_int16.tobytes())
 
-        wavio.write(filename, audio_int16, self.sample_rate, sampwidth=2)
         print(f"💾 Saved audio to: {filename}")
 
 
@@ -114,7 +193,7 @@ class StreamingRecorder:
         self.sample_rate = sample_rate
         self.channels = channels
         self.dtype = dtype
-        self.audio_frames = []
+        self.buffer = AudioBuffer(sample_rate=sample_rate, dtype=dtype)
         self.stream = None
         self.is_recording = False
 
@@ -123,14 +202,15 @@ class StreamingRecorder:
         if self.is_recording:
             return
 
-        self.audio_frames = []
+        # Fresh buffer per take so a previously returned view stays valid
+        self.buffer = AudioBuffer(sample_rate=self.sample_rate, dtype=self.dtype)
         self.is_recording = True
 
         def callback(indata, frames, time, status):
             if status:
                 print(f"⚠️ Audio status: {status}")
             if self.is_recording:
-                self.audio_frames.append(indata.copy())
+                self.buffer.write(indata)
 
         import sounddevice as sd
 
@@ -151,7 +231,7 @@ class StreamingRecorder:
             Recorded audio as NumPy array
         """
         if not self.is_recording:
-            return np.array([], dtype=np.float32)
+            return np.array([], dtype=self.dtype)
 
         self.is_recording = False
 
@@ -162,17 +242,24 @@ class StreamingRecorder:
 
         print("⏹️ Recording stopped")
 
-        if not self.audio_frames:
-            return np.array([], dtype=np.float32)
+        # Mono samples, zero-copy view into the capture buffer
+        return self.buffer.view()
+
+    def peek_audio(self, start: int = 0) -> np.ndarray:
+        """
+        Return the audio captured so far without stopping the recording.
 
-        # Concatenate all frames
-        audio_data = np.concatenate(self.audio_frames, axis=0)
+        Lets a consumer transcribe finished parts of a take while it is still
+        being recorded.
 
-        # Flatten if needed
-        if audio_data.ndim > 1:
-            audio_data = audio_data.flatten()
+        Args:
+            start: Sample offset to read from
 
-        return audio_data
+        Returns:
+            Mono samples from ``start`` to the current end (zero-copy view)
+        """
+        # The audio callback keeps writing past the end of this view
+        return self.buffer.view()[start:]
 
     def is_active(self) -> bool:
         """Check if recording is active."""
@@ -2,57 +2,418 @@
 ClipboardManager - Persistence and system-wide paste automation
 """
 
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterable, List, Optional
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-import json
+from itertools import islice
+import os
+import platform
+import threading
+import time
 
+from .history_io import BackgroundWriter, dumps_line, loads
 
-class ClipboardManager:
+# Paste shortcut for this OS, resolved once at import
+_IS_MAC = platform.system() == "Darwin"
+_PASTE_KEYS = ("command", "v") if _IS_MAC else ("ctrl", "v")
+
+
+def _paste_windows() -> bool:
+    """
+    Inject a full Ctrl+V chord with a single SendInput call.
+
+    The four key events are queued atomically, so no settle delay or
+    per-key interval is needed as with pyautogui.hotkey.
+
+    Returns:
+        bool: True if all key events were injected
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    VK_CONTROL = 0x11
+    VK_V = 0x56
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        # MOUSEINPUT is the largest member and fixes sizeof(INPUT)
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _anonymous_ = ("u",)
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    def key(vk: int, flags: int = 0) -> INPUT:
+        return INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=vk, dwFlags=flags))
+
+    events = (INPUT * 4)(
+        key(VK_CONTROL),
+        key(VK_V),
+        key(VK_V, KEYEVENTF_KEYUP),
+        key(VK_CONTROL, KEYEVENTF_KEYUP),
+    )
+    sent = ctypes.windll.user32.SendInput(4, events, ctypes.sizeof(INPUT))
+    return sent == 4
+
+
+def _paste_macos() -> bool:
+    """
+    Post Cmd+V through Quartz event services (requires pyobjc-framework-Quartz).
+
+    Returns:
+        bool: True if the events were posted
+    """
+    try:
+        import Quartz
+    except ImportError:
+        return False
+
+    KVK_ANSI_V = 9
+
+    for key_down in (True, False):
+        event = Quartz.CGEventCreateKeyboardEvent(None, KVK_ANSI_V, key_down)
+        Quartz.CGEventSetFlags(event, Quartz.kCGEventFlagMaskCommand)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+    return True
+
+
+def _paste_x11() -> bool:
+    """
+    Fake Ctrl+V through the XTEST extension (requires python-xlib and X11).
+
+    Returns:
+        bool: True if the events were sent
+    """
+    try:
+        from Xlib import X, XK
+        from Xlib.display import Display
+        from Xlib.ext import xtest
+    except ImportError:
+        return False
+
+    try:
+        display = Display()
+    except Exception:
+        # No X server to talk to (e.g. a Wayland-only session)
+        return False
+
+    try:
+        ctrl = display.keysym_to_keycode(XK.XK_Control_L)
+        v = display.keysym_to_keycode(XK.XK_v)
+        xtest.fake_input(display, X.KeyPress, ctrl)
+        xtest.fake_input(display, X.KeyPress, v)
+        xtest.fake_input(display, X.KeyRelease, v)
+        xtest.fake_input(display, X.KeyRelease, ctrl)
+        display.sync()
+        return True
+    finally:
+        display.close()
+
+
+def _copy_windows(text: str) -> bool:
+    """
+    Put text on the clipboard as CF_UNICODETEXT through the Win32 API.
+
+    Returns:
+        bool: True if the clipboard was set
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+
+    data = ctypes.create_unicode_buffer(text)
+    size = ctypes.sizeof(data)
+
+    if not user32.OpenClipboard(None):
+        return False
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, size)
+        if not handle:
+            return False
+        ctypes.memmove(kernel32.GlobalLock(handle), data, size)
+        kernel32.GlobalUnlock(handle)
+        if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            # Ownership only passes to the system on success
+            kernel32.GlobalFree(handle)
+            return False
+        return True
+    finally:
+        user32.CloseClipboard()
+
+
+def _copy_macos(text: str) -> bool:
+    """
+    Put text on the general pasteboard through AppKit (requires pyobjc).
+
+    Returns:
+        bool: True if the pasteboard was set
+    """
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+    except ImportError:
+        return False
+
+    pasteboard = NSPasteboard.generalPasteboard()
+    pasteboard.clearContents()
+    return bool(pasteboard.setString_forType_(text, NSPasteboardTypeString))
+
+
+def _copy_unavailable(text: str) -> bool:
+    """No in-process clipboard backend; callers fall back to pyperclip."""
+    return False
+
+
+# Native clipboard/paste backends for this OS, selected once at import.
+# On Linux the X11/Wayland selection must be served by a live owner process,
+# which xclip/xsel/wl-copy (via pyperclip) already provide.
+if platform.system() == "Windows":
+    _copy_impl = _copy_windows
+    _paste_impl = _paste_windows
+elif _IS_MAC:
+    _copy_impl = _copy_macos
+    _paste_impl = _paste_macos
+else:
+    _copy_impl = _copy_unavailable
+    _paste_impl = _paste_x11
+
+
+def copy_text(text: str) -> None:
+    """
+    Copy text to the system clipboard.
+
+    Uses the OS clipboard API in-process where available and falls back to
+    pyperclip, which shells out to pbcopy/xclip/xsel/wl-copy per call.
+
+    Args:
+        text: Text to copy
+    """
+    try:
+        if _copy_impl(text):
+            return
+    except Exception:
+        pass
+
+    import pyperclip
+
+    pyperclip.copy(text)
+
+
+def send_paste_shortcut() -> bool:
     """
-    Manages text persistence to history.json and automated clipboard paste operations.
+    Send the OS paste shortcut directly, bypassing pyautogui.
+
+    Returns:
+        bool: True if the shortcut was sent; False if the native backend is
+        unavailable and the caller should fall back to pyautogui
+    """
+    try:
+        return _paste_impl()
+    except Exception:
+        return False
+
+
+class ClipboardManager(BackgroundWriter):
+    """
+    Manages text persistence to history.jsonl and automated clipboard paste operations.
+
+    History is stored as JSON Lines, one entry per line, so saving an entry
+    appends it instead of rewriting the whole file. Only the newest
+    ``max_entries`` are kept in memory and in history.jsonl; older entries
+    rotate into monthly archives (history-YYYYMM.jsonl).
 
     Attributes:
-        history_file: Path to the history.json file
-        history: In-memory list of history entries
+        history_file: Path to the history.jsonl file
+        history: In-memory deque of the most recent history entries
     """
 
-    def __init__(self, output_dir: str = "output") -> None:
+    def __init__(self, output_dir: str = "output", max_entries: int = 1000) -> None:
         """
         Initialize ClipboardManager with output directory.
 
         Args:
-            output_dir: Directory path for storing history.json
+            output_dir: Directory path for storing history.jsonl
+            max_entries: Number of recent entries kept before rotating to archives
         """
         self.output_path = Path(output_dir)
         self.output_path.mkdir(parents=True, exist_ok=True)
 
-        self.history_file = self.output_path / "history.json"
-        self.history: List[Dict] = []
+        self.history_file = self.output_path / "history.jsonl"
+        self.legacy_history_file = self.output_path / "history.json"
+        self.max_entries = max_entries
+        self.history: Deque[Dict] = deque(maxlen=max_entries)
+
+        # Entries saved in memory but not yet appended to the file, and
+        # entries rotated out of memory but not yet archived
+        self._pending: List[Dict] = []
+        self._rotated: List[Dict] = []
+
+        # Lines in history.jsonl; compacted once rotation doubles it
+        self._file_entries = 0
+
+        # Guards self.history / serializes file writes respectively
+        self._lock = threading.Lock()
+        self._file_lock = threading.Lock()
 
         self._load_history()
 
+        # Persist in the background so the paste path never waits on disk
+        self._start_writer()
+
         print(f"📋 ClipboardManager initialized: {self.history_file}")
 
     def _load_history(self) -> None:
-        """Load existing history from history.json."""
+        """Load existing history from history.jsonl, migrating history.json once."""
+        entries: List[Dict] = []
         if self.history_file.exists():
+            with open(self.history_file, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entries.append(loads(line))
+                    except ValueError:  # json's and orjson's decode errors
+                        # A crash mid-append can leave a torn last line
+                        print("⚠️ Skipping unreadable history line")
+            print(f"📂 Loaded {len(entries)} history entries")
+            self._file_entries = len(entries)
+            rewrite = len(entries) > self.max_entries
+        elif self.legacy_history_file.exists():
             try:
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    self.history = json.load(f)
-                print(f"📂 Loaded {len(self.history)} history entries")
-            except json.JSONDecodeError:
+                with open(self.legacy_history_file, "rb") as f:
+                    entries = loads(f.read())
+                print(f"📦 Migrating {len(entries)} entries from history.json")
+            except ValueError:
                 print("⚠️ Could not parse history.json, starting fresh")
-                self.history = []
+            rewrite = True
         else:
             print("📝 Creating new history file")
-            self.history = []
+            rewrite = True
+
+        # Anything beyond the cap is archived by the rewrite below
+        overflow = max(0, len(entries) - self.max_entries)
+        self._rotated = entries[:overflow]
+        self.history.extend(entries[overflow:])
+
+        if rewrite:
             self._save_history()
 
+    def _archive(self, entries: Iterable[Dict]) -> None:
+        """Append rotated-out entries to their monthly history-YYYYMM.jsonl."""
+        by_month: Dict[str, List[bytes]] = {}
+        for entry in entries:
+            month = str(entry.get("timestamp", ""))[:7].replace("-", "") or "unknown"
+            by_month.setdefault(month, []).append(dumps_line(entry))
+
+        for month, lines in by_month.items():
+            with open(self.output_path / f"history-{month}.jsonl", "ab") as f:
+                f.write(b"".join(lines))
+
     def _save_history(self) -> None:
-        """Save history to history.json."""
-        with open(self.history_file, "w", encoding="utf-8") as f:
-            json.dump(self.history, f, indent=2, ensure_ascii=False)
+        """Rewrite history.jsonl from the in-memory history."""
+        with self._file_lock:
+            self._rewrite_history_file()
+
+    def _rewrite_history_file(self) -> None:
+        """
+        Archive rotated entries and rewrite history.jsonl.
+
+        Must be called with ``self._file_lock`` held. Rotated entries stay in
+        history.jsonl until this runs, so after an unclean exit every entry is
+        in exactly one of history.jsonl and the archives.
+        """
+        # Snapshot under the file lock so writes land in order
+        with self._lock:
+            snapshot = list(self.history)
+            rotated, self._rotated = self._rotated, []
+            pending, self._pending = self._pending, []
+
+        try:
+            self._archive(rotated)
+        except OSError:
+            with self._lock:
+                self._rotated = rotated + self._rotated
+                self._pending = pending + self._pending
+            raise
+
+        # Write a sibling and swap it in, so a crash never truncates history
+        tmp_file = self.history_file.with_name(self.history_file.name + ".tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(b"".join(dumps_line(entry) for entry in snapshot))
+            os.replace(tmp_file, self.history_file)
+        except OSError:
+            # Not in history.jsonl yet: append them on the next write
+            with self._lock:
+                self._pending = pending + self._pending
+            raise
+        self._file_entries = len(snapshot)
+
+    def _append_pending(self) -> None:
+        """Append new entries to history.jsonl, compacting it when due."""
+        with self._file_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+
+            if pending:
+                try:
+                    with open(self.history_file, "ab") as f:
+                        f.write(b"".join(dumps_line(entry) for entry in pending))
+                except OSError as e:
+                    print(f"⚠️ Could not write history: {e}")
+                    with self._lock:
+                        # Retry with the next batch
+                        self._pending = pending + self._pending
+                    return
+                self._file_entries += len(pending)
+
+            # Archive rotated entries and drop them from history.jsonl once
+            # they make up half of it, keeping the rewrite cost amortized O(1)
+            if self._file_entries > 2 * self.max_entries:
+                self._rewrite_history_file()
+
+    def flush(self) -> None:
+        """Write any pending history entries to disk immediately."""
+        super().flush()
+
+        # Archive rotated entries now rather than at the next load
+        if self._file_entries > len(self.history):
+            self._save_history()
 
     def save_entry(
         self, transcription: str, refined_text: str, metadata: Optional[Dict] = None
@@ -72,8 +433,13 @@ class ClipboardManager:
             "metadata": metadata or {},
         }
 
-        self.history.append(entry)
-        self._save_history()
+        with self._lock:
+            if len(self.history) == self.max_entries:
+                # The deque is about to drop its oldest entry
+                self._rotated.append(self.history[0])
+            self.history.append(entry)
+            self._pending.append(entry)
+        self._dirty.set()
 
         print(f"💾 Saved to history (total: {len(self.history)} entries)")
 
@@ -84,9 +450,7 @@ class ClipboardManager:
         Args:
             text: Text to copy
         """
-        import pyperclip
-
-        pyperclip.copy(text)
+        copy_text(text)
         print(f"📋 Copied to clipboard: {text[:50]}...")
 
     def paste_to_active_window(self, delay: float = 0.1) -> None:
@@ -96,19 +460,19 @@ class ClipboardManager:
         Args:
             delay: Delay in seconds before pasting
         """
-        import platform
+        # Small delay to ensure clipboard is ready
+        if delay > 0:
+            time.sleep(delay)
 
-        import pyautogui
+        if not send_paste_shortcut():
+            # No native backend available: fall back to pyautogui
+            import pyautogui
 
-        # Small delay to ensure clipboard is ready
-        pyautogui.sleep(delay)
+            pyautogui.hotkey(*_PASTE_KEYS)
 
-        # Detect OS and use appropriate paste shortcut
-        if platform.system() == "Darwin":  # macOS
-            pyautogui.hotkey("command", "v")
+        if _IS_MAC:
             print("⌘+V Pasted to active window (macOS)")
         else:  # Windows/Linux
-            pyautogui.hotkey("ctrl", "v")
             print("🔽 Ctrl+V Pasted to active window")
 
     def copy_and_paste(
@@ -147,13 +511,17 @@ class ClipboardManager:
         Returns:
             List of history entries
         """
-        if limit:
-            return self.history[-limit:]
-        return self.history
+        with self._lock:
+            if limit:
+                return list(
+                    islice(self.history, max(0, len(self.history) - limit), None)
+                )
+            return list(self.history)
 
     def clear_history(self) -> None:
         """Clear all history entries."""
-        self.history = []
+        with self._lock:
+            self.history.clear()
         self._save_history()
         print("🗑️ History cleared")
 
@@ -0,0 +1,84 @@
+"""
+CPU feature detection for choosing the CTranslate2 compute type.
+
+int8 inference only beats float32 when the CPU has integer dot-product
+instructions (x86 VNNI, ARM dotprod/i8mm); on plain AVX2 the int8 weights
+still save memory bandwidth, but activations are best kept in float32.
+"""
+
+import functools
+import logging
+import platform
+from typing import FrozenSet
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Flag names as reported by /proc/cpuinfo and by py-cpuinfo
+INT8_DOT_PRODUCT_FLAGS = frozenset(
+    {"avx512_vnni", "avx512vnni", "avx_vnni", "avxvnni", "asimddp", "dotprod", "i8mm"}
+)
+
+
+@functools.lru_cache(maxsize=1)
+def cpu_flags() -> FrozenSet[str]:
+    """
+    Return the instruction-set flags of the current CPU.
+
+    Uses py-cpuinfo when installed, otherwise /proc/cpuinfo ('flags' on x86,
+    'Features' on ARM). Returns an empty set when neither is available.
+    """
+    try:
+        import cpuinfo
+
+        return frozenset(cpuinfo.get_cpu_info().get("flags", []))
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key.strip() in ("flags", "Features"):
+                    return frozenset(value.split())
+    except OSError:
+        pass
+
+    return frozenset()
+
+
+def int8_is_fast() -> bool:
+    """Check whether int8 weights run at least as fast as float32 here."""
+    flags = cpu_flags()
+    if not flags:
+        # Unknown (e.g. macOS/Windows without py-cpuinfo): Apple Silicon and
+        # any x86 CPU from the last decade handle int8 well
+        return True
+    return bool(flags & INT8_DOT_PRODUCT_FLAGS) or "avx2" in flags
+
+
+@functools.lru_cache(maxsize=1)
+def pick_compute_type() -> str:
+    """
+    Pick the CPU compute type for WhisperModel from the CPU's features.
+
+    - int8 dot-product instructions (VNNI, dotprod, i8mm): 'int8'
+    - AVX2 only: 'int8_float32' (int8 weights, float32 activations)
+    - neither: 'float32', since int8 would run on emulated kernels
+
+    Returns:
+        CTranslate2 compute type
+    """
+    flags = cpu_flags()
+    if not flags or flags & INT8_DOT_PRODUCT_FLAGS:
+        compute_type = "int8"
+    elif "avx2" in flags:
+        compute_type = "int8_float32"
+    else:
+        compute_type = "float32"
+
+    logger.info(
+        "CPU %s: using compute type %s", platform.machine() or "unknown", compute_type
+    )
+    return compute_type
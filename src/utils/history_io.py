@@ -0,0 +1,73 @@
+"""
+History I/O - JSON Lines serialization and the background history writer
+shared by ClipboardManager, HistoryManager and the Tk GUI.
+"""
+
+import atexit
+import json
+import logging
+import threading
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is the fallback
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def dumps_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize one history entry as a UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(
+            entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        )
+    return (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class BackgroundWriter:
+    """
+    Mixin that persists pending history entries on a daemon thread.
+
+    Subclasses implement _append_pending() and call _start_writer() once
+    their state is set up; setting ``self._dirty`` wakes the writer, so
+    bursts of saves coalesce into a single append. Pending entries are also
+    flushed at interpreter exit.
+    """
+
+    def _start_writer(self) -> None:
+        """Start the writer thread and register the exit-time flush."""
+        self._dirty = threading.Event()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="history-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.flush)
+
+    def _append_pending(self) -> None:
+        """Write the entries saved since the last call."""
+        raise NotImplementedError
+
+    def _write_loop(self) -> None:
+        """Background writer: append new entries whenever there are any."""
+        while True:
+            self._dirty.wait()
+            self._dirty.clear()
+            try:
+                self._append_pending()
+            except Exception as e:
+                # Keep the thread alive: the next save retries the write
+                logger.error("Failed to write history: %s", e)
+
+    def flush(self) -> None:
+        """Write any pending history entries to disk immediately."""
+        self._dirty.clear()
+        self._append_pending()
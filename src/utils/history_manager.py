@@ -1,32 +1,100 @@
 """
 HistoryManager - Dictation Memory Management Utility
-Handles persistent storage of transcription history to JSON.
+Handles persistent storage of transcription history as NDJSON
+(newline-delimited JSON, one entry per line).
 """
 
-import json
 import logging
+import mmap
+import os
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from .history_io import BackgroundWriter, dumps_line, loads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Default history file path
-DEFAULT_HISTORY_PATH = Path("output/history.json")
+DEFAULT_HISTORY_PATH = Path("output/history.jsonl")
+
+
+def _parse_line(line: bytes) -> Optional[Dict[str, str]]:
+    """
+    Parse one history line, or return None for a blank or unreadable line.
+
+    Appends that were cut short (e.g. by a crash mid-write) only damage
+    their own line, so the rest of the history stays readable.
+    """
+    if not line.strip():
+        return None
+    try:
+        return loads(line)
+    except ValueError:  # json's and orjson's decode errors
+        logger.warning("Skipping unreadable history line: %.80r", line)
+        return None
+
+
+def _write_atomic(file_path: Path, data: bytes) -> None:
+    """
+    Replace ``file_path`` with ``data`` without exposing a partial file.
+
+    The data goes to a temporary sibling first, which os.replace then swaps
+    in atomically: readers see either the old or the new file.
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+
+
+def _migrate_legacy_history(file_path: Path) -> None:
+    """
+    Convert a JSON-array history file next to ``file_path`` into NDJSON once.
+
+    Earlier versions stored the whole history as one JSON array in
+    ``history.json``; it is left in place after conversion.
+
+    Args:
+        file_path: Path of the NDJSON history file
+    """
+    legacy_path = file_path.with_suffix(".json")
+    if file_path.exists() or legacy_path == file_path or not legacy_path.exists():
+        return
+
+    try:
+        with open(legacy_path, "rb") as f:
+            content = f.read().strip()
+        history = loads(content) if content else []
+        if not isinstance(history, list):
+            logger.warning("Legacy history file corrupted, not migrating")
+            return
+    except ValueError as e:  # json's and orjson's decode errors
+        logger.warning("Could not parse %s: %s. Not migrating.", legacy_path.name, e)
+        return
+
+    # Atomic, so an interrupted migration is simply retried next time
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(file_path, b"".join(dumps_line(entry) for entry in history))
+
+    logger.info("Migrated %d entries from %s", len(history), legacy_path.name)
 
 
 def log_to_history(refined_text: str, history_path: Optional[Path] = None) -> bool:
     """
-    Append a transcription entry to the history JSON file.
+    Append a transcription entry to the NDJSON history file.
 
-    Creates the output directory and history.json file if they don't exist.
-    Each entry contains a timestamp and the refined content.
+    Creates the output directory and history.jsonl file if they don't exist.
+    Each entry contains a timestamp and the refined content. Only the new
+    line is written, so logging cost does not grow with the history size.
 
     Args:
         refined_text: The refined transcription text to log
-        history_path: Custom path to history.json (optional)
+        history_path: Custom path to history.jsonl (optional)
 
     Returns:
         bool: True if logging succeeded, False otherwise
@@ -35,98 +103,107 @@ def log_to_history(refined_text: str, history_path: Optional[Path] = None) -> bo
         >>> log_to_history("This is a test transcription about Python and RAG.")
         True
 
-    Output format in history.json:
-        [
-            {
-                "timestamp": "2026-01-17T10:30:45.123456",
-                "content": "This is a test transcription about Python and RAG."
-            }
-        ]
+    Output format in history.jsonl (one entry per line):
+        {"timestamp": "2026-01-17T10:30:45.123456", "content": "This is a test transcription about Python and RAG."}
+    """
+    entry = _new_entry(refined_text)
+    if entry is None:
+        return False
+
+    try:
+        _append_entries(history_path or DEFAULT_HISTORY_PATH, [entry])
+    except Exception as e:
+        logger.error("Failed to log to history: %s", e)
+        return False
+
+    logger.info("Logged to history: '%.50s...'", refined_text)
+    return True
+
+
+def _new_entry(refined_text: str) -> Optional[Dict[str, str]]:
+    """
+    Create a timestamped history entry.
+
+    Args:
+        refined_text: The refined transcription text to log
+
+    Returns:
+        The entry, or None if the text is empty
     """
     if not refined_text or not refined_text.strip():
         logger.warning("Empty text received, skipping history log")
-        return False
+        return None
 
-    # Use default path if not specified
-    file_path = history_path or DEFAULT_HISTORY_PATH
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "content": refined_text.strip(),
+    }
 
-    try:
-        # Ensure output directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load existing history or create new list
-        history: List[Dict[str, str]] = []
-        if file_path.exists():
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-                    if content:
-                        history = json.loads(content)
-                        if not isinstance(history, list):
-                            logger.warning("History file corrupted, starting fresh")
-                            history = []
-            except json.JSONDecodeError as e:
-                logger.warning(f"Could not parse history.json: {e}. Starting fresh.")
-                history = []
-
-        # Create new entry with timestamp
-        entry: Dict[str, str] = {
-            "timestamp": datetime.now().isoformat(),
-            "content": refined_text.strip(),
-        }
-
-        # Append to history
-        history.append(entry)
-
-        # Save updated history
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
-
-        logger.info(
-            f"Logged to history: '{refined_text[:50]}...' (total: {len(history)} entries)"
-        )
-        return True
+def _append_entries(file_path: Path, entries: List[Dict[str, str]]) -> None:
+    """
+    Append entries to the history file in a single write.
 
-    except Exception as e:
-        logger.error(f"Failed to log to history: {str(e)}")
-        return False
+    Args:
+        file_path: Path to the NDJSON history file
+        entries: Entries to append, oldest first
+    """
+    # Ensure output directory exists
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    _migrate_legacy_history(file_path)
+
+    data = b"".join(dumps_line(entry) for entry in entries)
+
+    # Append only; the rest of the file is never read except its last byte
+    with open(file_path, "a+b", buffering=64 * 1024) as f:
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                # Terminate a line cut short by an interrupted append
+                data = b"\n" + data
+        f.write(data)
+
+
+def _file_signature(file_path: Path) -> Tuple[int, int]:
+    """Return (mtime_ns, size) of a file, or (0, 0) if it does not exist."""
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        return 0, 0
+    return stat.st_mtime_ns, stat.st_size
 
 
 def get_history(
     history_path: Optional[Path] = None, limit: Optional[int] = None
 ) -> List[Dict[str, str]]:
     """
-    Retrieve transcription history from JSON file.
+    Retrieve transcription history from the NDJSON file.
 
     Args:
-        history_path: Custom path to history.json (optional)
+        history_path: Custom path to history.jsonl (optional)
         limit: Maximum number of entries to return (most recent first)
 
     Returns:
         List of history entries with timestamp and content
     """
     file_path = history_path or DEFAULT_HISTORY_PATH
+    _migrate_legacy_history(file_path)
 
     if not file_path.exists():
         logger.info("No history file found")
         return []
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            history = json.load(f)
-
-        if not isinstance(history, list):
-            logger.warning("Invalid history format")
-            return []
-
-        # Return limited entries if specified (most recent)
-        if limit:
-            return history[-limit:]
+        with open(file_path, "rb") as f:
+            # With a limit, only the last lines are kept while streaming
+            lines = deque(f, maxlen=limit) if limit else f
+            history = [e for e in map(_parse_line, lines) if e is not None]
 
         return history
 
     except Exception as e:
-        logger.error(f"Failed to read history: {str(e)}")
+        logger.error("Failed to read history: %s", e)
         return []
 
 
@@ -135,7 +212,7 @@ def clear_history(history_path: Optional[Path] = None) -> bool:
     Clear all history entries.
 
     Args:
-        history_path: Custom path to history.json (optional)
+        history_path: Custom path to history.jsonl (optional)
 
     Returns:
         bool: True if cleared successfully
@@ -143,53 +220,100 @@ def clear_history(history_path: Optional[Path] = None) -> bool:
     file_path = history_path or DEFAULT_HISTORY_PATH
 
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump([], f)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(file_path, b"")
 
         logger.info("History cleared successfully")
         return True
 
     except Exception as e:
-        logger.error(f"Failed to clear history: {str(e)}")
+        logger.error("Failed to clear history: %s", e)
         return False
 
 
+def _scan_history_file(file_path: Path) -> Dict[str, Any]:
+    """
+    Compute history statistics from a memory-mapped NDJSON file.
+
+    One streaming pass over the mapping yields the counts and the first and
+    last readable entries while holding a single line at a time, so memory
+    use stays flat however large the history grows.
+
+    Args:
+        file_path: Path to the NDJSON history file
+
+    Returns:
+        Dict with total_entries, plus first_entry, last_entry and
+        total_characters when the history is not empty
+    """
+    if _file_signature(file_path)[1] == 0:
+        return {}  # Missing or empty: a zero-length file cannot be mapped
+
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            total_entries = 0
+            total_characters = 0
+            first: Optional[Dict[str, str]] = None
+            last: Optional[Dict[str, str]] = None
+            for line in iter(mm.readline, b""):
+                entry = _parse_line(line)
+                if entry is not None:
+                    if first is None:
+                        first = entry
+                    last = entry
+                    total_entries += 1
+                    total_characters += len(entry.get("content", ""))
+
+    if first is None or last is None:
+        return {"total_entries": 0}
+
+    return {
+        "total_entries": total_entries,
+        "first_entry": first.get("timestamp"),
+        "last_entry": last.get("timestamp"),
+        "total_characters": total_characters,
+    }
+
+
 def get_history_stats(history_path: Optional[Path] = None) -> Dict[str, Any]:
     """
     Get statistics about the history file.
 
     Args:
-        history_path: Custom path to history.json (optional)
+        history_path: Custom path to history.jsonl (optional)
 
     Returns:
         Dict with entry count, file size, and date range
     """
     file_path = history_path or DEFAULT_HISTORY_PATH
-
-    history = get_history(history_path)
+    _migrate_legacy_history(file_path)
 
     stats: Dict[str, Any] = {
-        "total_entries": len(history),
+        "total_entries": 0,
         "file_exists": file_path.exists(),
         "file_path": str(file_path),
     }
 
-    if history:
-        stats["first_entry"] = history[0].get("timestamp")
-        stats["last_entry"] = history[-1].get("timestamp")
-        stats["total_characters"] = sum(len(h.get("content", "")) for h in history)
+    try:
+        stats.update(_scan_history_file(file_path))
+    except Exception as e:
+        logger.error("Failed to read history: %s", e)
 
     if file_path.exists():
         stats["file_size_kb"] = round(file_path.stat().st_size / 1024, 2)
 
-    logger.info(f"History stats: {stats['total_entries']} entries")
+    logger.info("History stats: %d entries", stats["total_entries"])
     return stats
 
 
-class HistoryManager:
+class HistoryManager(BackgroundWriter):
     """
     Class-based wrapper for history management functions.
     Provides instance-based access with custom configuration.
+
+    Keeps the parsed history in memory: the file is read once and re-read only
+    when its mtime or size shows another writer changed it. New entries are
+    written by a background thread, so log() never waits on disk.
     """
 
     def __init__(self, history_path: Optional[str] = None) -> None:
@@ -197,23 +321,92 @@ class HistoryManager:
         Initialize HistoryManager with optional custom path.
 
         Args:
-            history_path: Custom path to history.json
+            history_path: Custom path to history.jsonl
         """
         self.history_path = Path(history_path) if history_path else DEFAULT_HISTORY_PATH
-        logger.info(f"HistoryManager initialized: {self.history_path}")
+        self._cache: List[Dict[str, str]] = []
+        self._signature: Tuple[int, int] = (-1, -1)
+
+        # Entries logged but not yet appended to the file
+        self._pending: List[Dict[str, str]] = []
+
+        # Guards the cache, pending list and signature / serializes file
+        # writes respectively
+        self._lock = threading.Lock()
+        self._file_lock = threading.Lock()
+
+        self._refresh()
+
+        self._start_writer()
+
+        logger.info("HistoryManager initialized: %s", self.history_path)
+
+    def _refresh(self) -> None:
+        """Reload the cached history if the file changed on disk."""
+        with self._file_lock, self._lock:
+            signature = _file_signature(self.history_path)
+            if signature != self._signature:
+                # Keep entries the writer has not reached yet
+                self._cache = get_history(self.history_path) + self._pending
+                self._signature = _file_signature(self.history_path)
+
+    def _append_pending(self) -> None:
+        """Append logged entries to the history file."""
+        with self._file_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                unchanged = _file_signature(self.history_path) == self._signature
+
+            if not pending:
+                return
+
+            try:
+                _append_entries(self.history_path, pending)
+            except Exception as e:
+                logger.error("Failed to log to history: %s", e)
+                with self._lock:
+                    # Retry with the next batch
+                    self._pending = pending + self._pending
+                return
+
+            # If only our own append changed the file, the cache is current;
+            # otherwise leave the signature stale so the next read reloads
+            if unchanged:
+                with self._lock:
+                    self._signature = _file_signature(self.history_path)
 
     def log(self, refined_text: str) -> bool:
-        """Log refined text to history."""
-        return log_to_history(refined_text, self.history_path)
+        """Log refined text to history; the file is written in the background."""
+        entry = _new_entry(refined_text)
+        if entry is None:
+            return False
+
+        with self._lock:
+            self._cache.append(entry)
+            self._pending.append(entry)
+        self._dirty.set()
+
+        logger.info("Logged to history: '%.50s...'", refined_text)
+        return True
 
     def get_all(self, limit: Optional[int] = None) -> List[Dict[str, str]]:
         """Get all history entries."""
-        return get_history(self.history_path, limit)
+        self._refresh()
+        with self._lock:
+            return self._cache[-limit:] if limit else list(self._cache)
 
     def clear(self) -> bool:
         """Clear all history."""
-        return clear_history(self.history_path)
+        with self._file_lock:
+            cleared = clear_history(self.history_path)
+            if cleared:
+                with self._lock:
+                    self._cache = []
+                    self._pending = []
+                    self._signature = _file_signature(self.history_path)
+        return cleared
 
     def stats(self) -> Dict[str, Any]:
         """Get history statistics."""
+        self.flush()
         return get_history_stats(self.history_path)
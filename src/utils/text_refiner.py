@@ -2,9 +2,74 @@
 TextRefiner - Wispr-style text refinement with technical jargon mapping
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+import functools
+import logging
 import re
 
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Runs of word characters, used to prefilter text before the jargon regex
+_WORD_RE = re.compile(r"\w+")
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    """
+    Build a regex alternation matching any of the terms literally.
+
+    Longer terms come first so e.g. 'next.js' wins over 'next'.
+    """
+    ordered = sorted(terms, key=len, reverse=True)
+    return "|".join(_ESCAPED.get(t) or re.escape(t) for t in ordered)
+
+
+def _compile_refine_pattern(contractions: str, jargon: str = "") -> "re.Pattern[str]":
+    """
+    Compile the single regex that drives every rewrite in TextRefiner.refine.
+
+    Each named alternative is one rule; the match callback dispatches on
+    ``lastgroup``, so the text is scanned once instead of once per rule:
+
+    - jar / con: a jargon term or contraction (case-insensitive, whole words;
+      jargon is delimited by non-word characters so terms like '.net' match)
+    - pre: whitespace before punctuation, removed (unless it starts a
+      jargon term such as '.net')
+    - sent: sentence end followed by a lowercase word, capitalized and spaced
+    - glued: punctuation directly followed by a letter, spaced
+    - ws: any other whitespace that is not a single space, collapsed
+
+    Args:
+        contractions: Alternation of contraction keys
+        jargon: Alternation of jargon keys; the jar rule is left out if empty
+    """
+    words = f"{jargon}|{contractions}" if jargon else contractions
+    rules = [
+        rf"(?P<jar>(?i:(?<!\w)(?:{jargon})(?!\w)))" if jargon else None,
+        rf"(?P<con>(?i:\b(?:{contractions})\b))",
+        (
+            rf"(?P<pre>\s+(?=[.,!?;:])(?!(?i:(?:{jargon})(?!\w))))"
+            if jargon
+            else r"(?P<pre>\s+(?=[.,!?;:]))"
+        ),
+        # Jargon and contractions at a sentence start are capitalized by their
+        # own rule, so they must not be split here
+        rf"(?P<sent>[.!?]\s*(?!(?i:(?:{words})\b))[a-z])",
+        r"(?P<glued>[.,!?;:](?=[A-Za-z]))",
+        r"(?P<ws>\s{2,}|[^\S ])",
+    ]
+    return re.compile("|".join(rule for rule in rules if rule))
+
+
+def _follows_sentence_end(text: str, pos: int) -> bool:
+    """Check whether the last non-space character before pos ends a sentence."""
+    pos -= 1
+    while pos >= 0 and text[pos].isspace():
+        pos -= 1
+    return pos >= 0 and text[pos] in ".!?"
+
 
 class TextRefiner:
     """
@@ -31,10 +96,14 @@ class TextRefiner:
         "rag": "RAG",
         "llm": "LLM",
         "gpt": "GPT",
+        "nlp": "NLP",
+        "ml": "ML",
+        "ai": "AI",
         "openai": "OpenAI",
         "langchain": "LangChain",
         "langgraph": "LangGraph",
         "hugging face": "Hugging Face",
+        "huggingface": "HuggingFace",
         "pytorch": "PyTorch",
         "tensorflow": "TensorFlow",
         # Databases
@@ -69,7 +138,9 @@ class TextRefiner:
         "nginx": "Nginx",
         "apache": "Apache",
         # Frameworks
+        "reactjs": "React.js",
         "react": "React",
+        "vuejs": "Vue.js",
         "vue": "Vue",
         "angular": "Angular",
         "django": "Django",
@@ -88,11 +159,15 @@ class TextRefiner:
         "ide": "IDE",
         "cli": "CLI",
         "gui": "GUI",
+        "vscode": "VS Code",
         # Version Control
         "git": "Git",
         "github": "GitHub",
         "gitlab": "GitLab",
         "bitbucket": "Bitbucket",
+        # Product Names
+        "zukuriflow": "ZukuriFlow",
+        "internshala": "Internshala",
         # Other
         "oauth": "OAuth",
         "jwt": "JWT",
@@ -105,150 +180,205 @@ class TextRefiner:
         "vpn": "VPN",
     }
 
+    # Common contractions transcribed without apostrophes
+    CONTRACTIONS: Dict[str, str] = {
+        "im": "I'm",
+        "ive": "I've",
+        "ill": "I'll",
+        "id": "I'd",
+        "youre": "you're",
+        "youve": "you've",
+        "youll": "you'll",
+        "youd": "you'd",
+        "hes": "he's",
+        "shes": "she's",
+        "its": "it's",
+        "were": "we're",
+        "weve": "we've",
+        "well": "we'll",
+        "wed": "we'd",
+        "theyre": "they're",
+        "theyve": "they've",
+        "theyll": "they'll",
+        "theyd": "they'd",
+        "dont": "don't",
+        "doesnt": "doesn't",
+        "didnt": "didn't",
+        "cant": "can't",
+        "couldnt": "couldn't",
+        "wouldnt": "wouldn't",
+        "shouldnt": "shouldn't",
+        "wont": "won't",
+        "isnt": "isn't",
+        "arent": "aren't",
+        "wasnt": "wasn't",
+        "werent": "weren't",
+        "hasnt": "hasn't",
+        "havent": "haven't",
+        "hadnt": "hadn't",
+    }
+
+    # Distinct inputs whose refined text is kept; dictation repeats short
+    # phrases ("okay", "next slide") often enough to make this worthwhile
+    REFINE_CACHE_SIZE = 1024
+
+    # Compiled tables for the default maps, built once by the first instance:
+    # (jargon lookup, refine pattern, jargon first words, jargon-free pattern)
+    _COMPILED: Optional[
+        Tuple[Dict[str, str], "re.Pattern[str]", FrozenSet[str], "re.Pattern[str]"]
+    ] = None
+
     def __init__(self, custom_jargon: Dict[str, str] = None) -> None:
         """
         Initialize TextRefiner with optional custom jargon mappings.
 
+        Instances without custom jargon share the class-level compiled
+        patterns, so constructing one does not copy or compile anything.
+
         Args:
             custom_jargon: Additional jargon mappings to extend the default dictionary
         """
-        self.jargon_map = self.JARGON_MAP.copy()
+        (
+            self._jargon_lookup,
+            self._refine_pattern,
+            self._jargon_keyset,
+            self._plain_pattern,
+        ) = self._get_compiled()
+        self.jargon_map = self.JARGON_MAP
+
+        # Per instance, since results depend on this instance's jargon map
+        self._refine_cached = functools.lru_cache(maxsize=self.REFINE_CACHE_SIZE)(
+            self._refine
+        )
 
         if custom_jargon:
-            self.jargon_map.update(custom_jargon)
-
-        print(f"📝 TextRefiner initialized with {len(self.jargon_map)} jargon mappings")
+            self.jargon_map = {**self.JARGON_MAP, **custom_jargon}
+            self._compile_jargon_pattern()
+
+    @classmethod
+    def _get_compiled(
+        cls,
+    ) -> Tuple[
+        Dict[str, str], "re.Pattern[str]", Optional[FrozenSet[str]], "re.Pattern[str]"
+    ]:
+        """Compile the default jargon and contraction patterns on first use."""
+        if cls._COMPILED is None:
+            cls._COMPILED = cls._compile(cls.JARGON_MAP) + (
+                _compile_refine_pattern(_alternation(cls.CONTRACTIONS)),
+            )
+        return cls._COMPILED
 
     def refine(self, text: str) -> str:
         """
         Apply all refinement steps to the text.
 
+        Jargon mapping, contraction fixes, spacing cleanup and sentence
+        capitalization all happen in one regex pass (see
+        _compile_refine_pattern); the first letter and the ending
+        punctuation are then fixed in at most one more concatenation.
+
+        Repeated inputs are answered from a per-instance LRU cache.
+
         Args:
             text: Raw transcription text
 
         Returns:
             Refined and formatted text
         """
+        return self._refine_cached(text)
+
+    def _refine(self, text: str) -> str:
+        """Refine text without consulting the cache; see refine()."""
         if not text or not text.strip():
             return ""
 
         refined = text.strip()
 
-        # Step 1: Apply technical jargon mapping
-        refined = self._apply_jargon_mapping(refined)
-
-        # Step 2: Fix spacing
-        refined = self._fix_spacing(refined)
-
-        # Step 3: Auto-capitalize sentences
-        refined = self._capitalize_sentences(refined)
-
-        # Step 4: Add ending punctuation
-        refined = self._add_ending_punctuation(refined)
-
-        # Step 5: Fix common contractions
-        refined = self._fix_contractions(refined)
-
-        return refined
-
-    def _apply_jargon_mapping(self, text: str) -> str:
+        # Text without any jargon word skips the large jargon alternation
+        keyset = self._jargon_keyset
+        if keyset is not None and keyset.isdisjoint(_WORD_RE.findall(refined.lower())):
+            # Already refined (e.g. Whisper's own punctuated output, or a
+            # re-refine): nothing would change, so skip building a copy
+            if (
+                refined[0].isupper()
+                and refined[-1] in ".!?"
+                and self._plain_pattern.search(refined) is None
+            ):
+                return refined
+            pattern = self._plain_pattern
+        else:
+            pattern = self._refine_pattern
+        refined = pattern.sub(self._rewrite, refined)
+
+        # Capitalize the first character and add missing ending punctuation
+        # in a single concatenation, or none when both are already in place
+        head = refined[0].upper()
+        tail = "" if refined[-1] in ".!?" else "."
+        if head != refined[0]:
+            return head + refined[1:] + tail
+        return refined + tail if tail else refined
+
+    def _compile_jargon_pattern(self) -> None:
+        """Rebuild the refine regex for this instance's jargon map."""
+        (
+            self._jargon_lookup,
+            self._refine_pattern,
+            self._jargon_keyset,
+        ) = self._compile(self.jargon_map)
+
+    @classmethod
+    def _compile(
+        cls, jargon_map: Dict[str, str]
+    ) -> Tuple[Dict[str, str], "re.Pattern[str]", Optional[FrozenSet[str]]]:
         """
-        Replace technical terms with proper capitalization.
-
-        Uses word boundaries to avoid partial matches.
-        """
-        result = text
-
-        for term_lower, term_proper in self.jargon_map.items():
-            # Use word boundaries for accurate matching
-            pattern = r"\b" + re.escape(term_lower) + r"\b"
-            result = re.sub(pattern, term_proper, result, flags=re.IGNORECASE)
+        Build the refine regex for a jargon map.
 
-        return result
+        Also collects the first word of every term ('next' for 'next.js',
+        'net' for '.net'): text containing none of them cannot match, so it
+        is refined with the jargon-free pattern instead. If any term has no
+        word character at all there is nothing to filter on, and None is
+        returned so the full pattern is always used.
 
-    def _fix_spacing(self, text: str) -> str:
-        """Fix common spacing issues."""
-        # Remove multiple spaces
-        text = re.sub(r"\s+", " ", text)
-
-        # Remove space before punctuation
-        text = re.sub(r"\s+([.,!?;:])", r"\1", text)
-
-        # Ensure space after punctuation
-        text = re.sub(r"([.,!?;:])([A-Za-z])", r"\1 \2", text)
-
-        return text.strip()
+        Args:
+            jargon_map: Jargon mappings (term -> proper form)
 
-    def _capitalize_sentences(self, text: str) -> str:
-        """
-        Capitalize the first letter of each sentence.
+        Returns:
+            Tuple of (lowercase lookup, refine pattern, jargon first words)
         """
-        # Capitalize first character
-        if text:
-            text = text[0].upper() + text[1:]
-
-        # Capitalize after sentence endings (. ! ?)
-        text = re.sub(
-            r"([.!?])\s+([a-z])", lambda m: m.group(1) + " " + m.group(2).upper(), text
+        lookup = {k.lower(): v for k, v in jargon_map.items()}
+        pattern = _compile_refine_pattern(
+            _alternation(cls.CONTRACTIONS), _alternation(lookup)
         )
+        words = [_WORD_RE.search(k) for k in lookup]
+        keyset = None if None in words else frozenset(w.group(0) for w in words)
+        return lookup, pattern, keyset
 
-        return text
-
-    def _add_ending_punctuation(self, text: str) -> str:
+    def _rewrite(self, match: "re.Match[str]") -> str:
         """
-        Add period at the end if no punctuation exists.
+        Return the replacement for one match of the refine regex.
         """
-        if text and text[-1] not in ".!?":
-            text += "."
+        rule = match.lastgroup
+        found = match.group(0)
+
+        if rule == "jar" or rule == "con":
+            lookup = self._jargon_lookup if rule == "jar" else self.CONTRACTIONS
+            word = lookup[found.lower()]
+            if "a" <= word[0] <= "z" and _follows_sentence_end(
+                match.string, match.start()
+            ):
+                word = word[0].upper() + word[1:]
+            return word
+
+        if rule == "pre":
+            return ""
 
-        return text
+        if rule == "sent":
+            return found[0] + " " + found[-1].upper()
 
-    def _fix_contractions(self, text: str) -> str:
-        """
-        Fix common contractions that may be transcribed incorrectly.
-        """
-        contractions = {
-            r"\bim\b": "I'm",
-            r"\bive\b": "I've",
-            r"\bill\b": "I'll",
-            r"\bid\b": "I'd",
-            r"\byoure\b": "you're",
-            r"\byouve\b": "you've",
-            r"\byoull\b": "you'll",
-            r"\byoud\b": "you'd",
-            r"\bhes\b": "he's",
-            r"\bshes\b": "she's",
-            r"\bits\b": "it's",
-            r"\bwere\b": "we're",
-            r"\bweve\b": "we've",
-            r"\bwell\b": "we'll",
-            r"\bwed\b": "we'd",
-            r"\btheyre\b": "they're",
-            r"\btheyve\b": "they've",
-            r"\btheyll\b": "they'll",
-            r"\btheyd\b": "they'd",
-            r"\bdont\b": "don't",
-            r"\bdoesnt\b": "doesn't",
-            r"\bdidnt\b": "didn't",
-            r"\bcant\b": "can't",
-            r"\bcouldnt\b": "couldn't",
-            r"\bwouldnt\b": "wouldn't",
-            r"\bshouldnt\b": "shouldn't",
-            r"\bwont\b": "won't",
-            r"\bisnt\b": "isn't",
-            r"\barent\b": "aren't",
-            r"\bwasnt\b": "wasn't",
-            r"\bwerent\b": "weren't",
-            r"\bhasnt\b": "hasn't",
-            r"\bhavent\b": "haven't",
-            r"\bhadnt\b": "hadn't",
-        }
-
-        result = text
-        for pattern, replacement in contractions.items():
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-
-        return result
+        if rule == "glued":
+            return found + " "
+
+        return " "
 
     def add_custom_jargon(self, term: str, proper_form: str) -> None:
         """
@@ -258,5 +388,30 @@ class TextRefiner:
             term: Lowercase term to match
             proper_form: Proper capitalization/format
         """
-        self.jargon_map[term.lower()] = proper_form
-        print(f"✅ Added custom jargon: '{term}' -> '{proper_form}'")
+        # Copy rather than update in place: the default map is shared
+        self.jargon_map = {**self.jargon_map, term.lower(): proper_form}
+        self._compile_jargon_pattern()
+        # Cached results were refined with the old map
+        self._refine_cached.cache_clear()
+        logger.info("Added custom jargon: '%s' -> '%s'", term, proper_form)
+
+    # The old refiner.TextRefiner API, kept for callers written against it
+    def add_mapping(self, term: str, proper_form: str) -> None:
+        """Alias of add_custom_jargon()."""
+        self.add_custom_jargon(term, proper_form)
+
+    @property
+    def technical_mappings(self) -> Mapping[str, str]:
+        """
+        The jargon map (term -> proper form) this instance applies.
+
+        Read-only view; use add_mapping() to add terms.
+        """
+        return MappingProxyType(self.jargon_map)
+
+
+# Regex-escaped forms of the built-in keys, computed once at import so that
+# rebuilding a pattern for custom jargon only escapes the new terms
+_ESCAPED: Dict[str, str] = {
+    k: re.escape(k) for k in (*TextRefiner.JARGON_MAP, *TextRefiner.CONTRACTIONS)
+}
@@ -2,9 +2,145 @@
 WhisperEngine - Advanced Faster-Whisper transcription with VAD and technical prompts
 """
 
-from typing import Optional, List, Dict
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+import os
+import threading
+
+from ._env import CPU_THREADS  # Must run before ctranslate2 is imported
+from .cpu_caps import int8_is_fast
+import ctranslate2
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.utils import download_model
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 4-bit weight quantization: ~2x smaller than int8, at some accuracy cost
+INT4_COMPUTE_TYPES = ("int4", "int8_int4")
+
+
+def resolve_compute_type(device: str, compute_type: str) -> str:
+    """
+    Pick the fastest quantization the local CTranslate2 build supports.
+
+    On CUDA, int8 weights are paired with float16 activations (tensor cores),
+    the fastest CUDA setting; on CPU, plain int8 maps onto the VNNI dot-product kernels when available.
+    4-bit types ('int4', 'int8_int4') halve the weights again for large models
+    but are only used when the installed build offers them; otherwise they
+    fall back to int8.
+
+    Args:
+        device: Compute device ('cpu' or 'cuda')
+        compute_type: Requested quantization type
+
+    Returns:
+        Compute type to pass to WhisperModel
+    """
+    supported = ctranslate2.get_supported_compute_types(device)
+    logger.info(
+        "CTranslate2 %s %s compute types: %s",
+        ctranslate2.__version__,
+        device,
+        sorted(supported),
+    )
+
+    if compute_type in INT4_COMPUTE_TYPES and compute_type not in supported:
+        logger.warning(
+            "%s is not supported on %s, falling back to int8", compute_type, device
+        )
+        compute_type = "int8"
+
+    if compute_type.startswith("int8") and not any(
+        t.startswith("int8") for t in supported
+    ):
+        logger.warning(
+            "No accelerated int8 backend on %s; "
+            "install ctranslate2>=4.4 (oneDNN/MKL) for faster transcription",
+            device,
+        )
+
+    if device == "cpu" and compute_type == "float32" and int8_is_fast():
+        logger.warning(
+            "float32 on this CPU is several times slower than int8; "
+            "pass compute_type='int8' unless you need full precision"
+        )
+
+    if device == "cuda" and compute_type == "int8" and "int8_float16" in supported:
+        return "int8_float16"
+
+    return compute_type
+
+
+def prepare_model_dir(model_size: str) -> str:
+    """
+    Resolve a model name to its local CTranslate2 directory and prefetch weights.
+
+    A cached model is opened with ``local_files_only`` so start-up does not wait
+    on a Hugging Face Hub round-trip; the first run downloads it once. On Linux
+    the kernel is asked to read model.bin ahead so the load hits the page cache.
+
+    Args:
+        model_size: Model name (e.g. 'distil-small.en') or a local model path
+
+    Returns:
+        Path to the local model directory
+    """
+    if os.path.isdir(model_size):
+        model_dir = model_size
+    else:
+        try:
+            model_dir = download_model(model_size, local_files_only=True)
+        except Exception:
+            model_dir = download_model(model_size)
+
+    weights = os.path.join(model_dir, "model.bin")
+    if hasattr(os, "posix_fadvise") and os.path.exists(weights):
+        fd = os.open(weights, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+    return model_dir
+
+
+def pack_clip_windows(
+    speech: List[Dict[str, int]], max_samples: int = 30 * 16000
+) -> List[Dict[str, int]]:
+    """
+    Group VAD speech chunks into clips for the batched pipeline.
+
+    Each clip is padded to a full 30s encoder window, so passing every short
+    utterance as its own clip multiplies encoder work. Consecutive chunks
+    are instead packed into windows of at most max_samples on the
+    concatenated speech timeline, breaking between chunks; a single overlong
+    chunk is split hard.
+
+    Args:
+        speech: Speech chunks (sample offsets) from get_speech_timestamps
+        max_samples: Longest clip Whisper can take in one window
+
+    Returns:
+        List of {"start", "end"} sample offsets into the speech-only audio
+    """
+    windows: List[Dict[str, int]] = []
+    start = end = 0
+    for chunk in speech:
+        length = chunk["end"] - chunk["start"]
+        if end > start and end - start + length > max_samples:
+            windows.append({"start": start, "end": end})
+            start = end
+        end += length
+        while end - start > max_samples:
+            windows.append({"start": start, "end": start + max_samples})
+            start += max_samples
+    if end > start:
+        windows.append({"start": start, "end": end})
+    return windows
 
 
 class WhisperEngine:
@@ -47,126 +183,356 @@ class WhisperEngine:
         "OpenAI",
     ]
 
+    # Technical initial prompt, built once when the class is defined
+    INITIAL_PROMPT = (
+        "This is a technical recording containing specialized terminology. "
+        f"Common terms include: {', '.join(TECHNICAL_KEYWORDS)}. "
+        "Transcribe accurately with proper capitalization and punctuation."
+    )
+
+    # Clips up to this long are decoded greedily without the initial prompt,
+    # whose tokens would otherwise outnumber the ones being transcribed
+    SHORT_CLIP_SECONDS = 3.0
+
+    # Number of VAD chunks decoded together on the batched path
+    BATCH_SIZE = 8
+
+    # Silero VAD settings for the single VAD pass in transcribe()
+    VAD_PARAMETERS = dict(
+        threshold=0.5, min_speech_duration_ms=250, min_silence_duration_ms=500
+    )
+
     def __init__(
         self,
-        model_size: str = "base",
+        model_size: str = "distil-small.en",
         device: str = "cpu",
         compute_type: str = "int8",
         language: Optional[str] = "en",
+        verbose: bool = False,
+        cpu_threads: int = CPU_THREADS,
+        num_workers: int = 1,
+        beam_size: int = 1,
+        temperature: float = 0.0,
+        condition_on_previous_text: bool = False,
     ) -> None:
         """
         Initialize the WhisperEngine with specified configuration.
 
         Args:
-            model_size: Model size ('tiny', 'base', 'small', 'medium', 'large')
+            model_size: Model size ('tiny', 'base', 'small', 'medium', 'large') or a
+                Distil-Whisper checkpoint ('distil-small.en', 'distil-large-v2')
             device: Compute device ('cpu' or 'cuda')
-            compute_type: Quantization type ('int8', 'float16', 'float32')
+            compute_type: Quantization type ('int8', 'float16', 'float32'); 'int8' is
+                upgraded to 'int8_float16' on CUDA when supported. 'int4' /
+                'int8_int4' trade some accuracy for half the weight memory of
+                int8 and fall back to 'int8' where unsupported
             language: Target language code (e.g., 'en', 'es'). None for auto-detect.
+            verbose: Also log per-transcription details (detected language,
+                skipped silent clips), which are DEBUG records by default
+            cpu_threads: CTranslate2 threads per model call; defaults to the
+                physical core count
+            num_workers: Model replicas for concurrent transcribe() calls
+            beam_size: Default beam width (1 = greedy, about a fifth of the
+                decoder work of faster-whisper's default of 5)
+            temperature: Sampling temperature; 0.0 disables the fallback
+                re-decodes at higher temperatures
+            condition_on_previous_text: Feed each 30s window the previous
+                window's text (off: dictation clips are independent)
         """
-        print(
-            f"🔧 Loading Faster-Whisper model: {model_size} on {device} ({compute_type})"
+        if verbose:
+            logger.setLevel(logging.DEBUG)
+
+        compute_type = resolve_compute_type(device, compute_type)
+
+        logger.info(
+            "Loading Faster-Whisper model: %s on %s (%s)",
+            model_size,
+            device,
+            compute_type,
         )
 
-        self.model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        # One thread per physical core keeps the int8 GEMM kernels busy without
+        # oversubscribing hyperthreads; one worker since calls are serialized.
+        self.model = WhisperModel(
+            prepare_model_dir(model_size),
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
+        )
+
+        # Batches VAD-split chunks of long recordings through one encoder call
+        self.batched_model = BatchedInferencePipeline(model=self.model)
 
         self.language = language
 
-        # Construct technical initial prompt
-        keywords_str = ", ".join(self.TECHNICAL_KEYWORDS)
-        self.initial_prompt = (
-            f"This is a technical recording containing specialized terminology. "
-            f"Common terms include: {keywords_str}. "
-            f"Transcribe accurately with proper capitalization and punctuation."
-        )
+        # Decoding defaults; greedy and deterministic for interactive dictation
+        self.beam_size = beam_size
+        self.temperature = temperature
+        self.condition_on_previous_text = condition_on_previous_text
 
-        print("✅ WhisperEngine initialized successfully")
+        self.initial_prompt = self.INITIAL_PROMPT
+
+        # Conversion target reused across transcribe() calls (30s to start,
+        # grown on demand); the lock keeps overlapping calls off it
+        self._scratch = np.empty(30 * 16000, dtype=np.float32)
+        self._scratch_lock = threading.Lock()
+
+        logger.info("WhisperEngine initialized successfully")
+
+    @staticmethod
+    def _prepare_audio(
+        audio_data: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Return the audio as contiguous float32, scaled into [-1, 1] if needed.
+
+        Float32 input is used as-is without a copy. The peak is taken from
+        min()/max() reductions, which allocate no temporary array, and the
+        scaling is done in place when the buffer is our own conversion.
+        Integer PCM (e.g. int16 from the microphone) is converted and scaled
+        to full range in one pass.
+
+        Args:
+            audio_data: Audio numpy array of any numeric dtype
+            out: Optional float32 buffer of the same length to convert or
+                scale into instead of allocating a new array
+
+        Returns:
+            Float32 audio with peak amplitude at most 1.0
+        """
+        if np.issubdtype(audio_data.dtype, np.signedinteger):
+            # Full-scale PCM: int16 -> 1/32768, no peak scan needed
+            scale = np.float32(1.0 / (np.iinfo(audio_data.dtype).max + 1))
+            return np.multiply(audio_data, scale, out=out, dtype=np.float32)
+
+        owned = audio_data.dtype != np.float32 or not audio_data.flags.c_contiguous
+        if owned and out is not None:
+            np.copyto(out, audio_data, casting="same_kind")
+            audio_data = out
+        else:
+            audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        if audio_data.size == 0:
+            return audio_data
+
+        peak = max(-float(audio_data.min()), float(audio_data.max()))
+        if peak > 1.0:
+            if owned:
+                np.multiply(audio_data, 1.0 / peak, out=audio_data)
+            elif out is not None:
+                # Never rescale the caller's buffer behind their back
+                audio_data = np.multiply(audio_data, np.float32(1.0 / peak), out=out)
+            else:
+                audio_data = audio_data * np.float32(1.0 / peak)
+        return audio_data
+
+    def _scratch_view(self, n_samples: int) -> np.ndarray:
+        """Return the first n_samples of the scratch buffer, growing it if needed."""
+        if self._scratch.size < n_samples:
+            self._scratch = np.empty(n_samples, dtype=np.float32)
+        return self._scratch[:n_samples]
 
     def transcribe(
-        self, audio_data: np.ndarray, use_vad: bool = True, beam_size: int = 5
+        self,
+        audio_data: np.ndarray,
+        use_vad: bool = True,
+        beam_size: Optional[int] = None,
     ) -> str:
         """
         Transcribe audio data with VAD filtering and technical prompt.
 
         Args:
-            audio_data: Audio numpy array (float32, [-1, 1] range)
+            audio_data: Audio numpy array (float32 in [-1, 1], or int16 PCM,
+                which is converted into a reusable buffer)
             use_vad: Enable Voice Activity Detection to filter silences
-            beam_size: Beam search size for decoding
+            beam_size: Beam search size for decoding; defaults to the engine's
+                beam_size (1 = greedy, best for short dictation)
+                (clips up to SHORT_CLIP_SECONDS are always greedy and unprompted)
 
         Returns:
             Transcribed text with technical terms properly formatted
         """
-        # Ensure audio is float32 and normalized
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
+        # Convert into the reusable scratch buffer unless another call holds it
+        use_scratch = audio_data.ndim == 1 and self._scratch_lock.acquire(
+            blocking=False
+        )
+        try:
+            out = self._scratch_view(len(audio_data)) if use_scratch else None
+            return self._transcribe(
+                self._prepare_audio(audio_data, out),
+                use_vad,
+                self.beam_size if beam_size is None else beam_size,
+            )
+        finally:
+            if use_scratch:
+                self._scratch_lock.release()
 
-        # Normalize if needed
-        if np.abs(audio_data).max() > 1.0:
-            audio_data = audio_data / np.abs(audio_data).max()
+    def _transcribe(self, audio_data: np.ndarray, use_vad: bool, beam_size: int) -> str:
+        """Transcribe prepared float32 audio; see transcribe()."""
+        # Silero VAD runs once here; faster-whisper's own VAD stays off
+        speech = self._speech_timestamps(audio_data) if use_vad else []
+        if use_vad and not speech:
+            # Silent take (e.g. accidental click): skip the encoder and decoder
+            logger.debug("No speech detected, skipping transcription")
+            return ""
 
-        # Transcribe with VAD and technical prompt
-        segments, info = self.model.transcribe(
-            audio_data,
+        if use_vad:
+            duration = sum(chunk["end"] - chunk["start"] for chunk in speech) / 16000
+        else:
+            duration = len(audio_data) / 16000
+
+        short_clip = duration <= self.SHORT_CLIP_SECONDS
+        if short_clip:
+            beam_size = 1
+
+        options = dict(
             language=self.language,
-            initial_prompt=self.initial_prompt,
+            initial_prompt=None if short_clip else self.initial_prompt,
             beam_size=beam_size,
             best_of=beam_size,
-            temperature=0.0,
-            vad_filter=use_vad,  # Enable VAD to filter silences
-            vad_parameters=dict(
-                threshold=0.5, min_speech_duration_ms=250, min_silence_duration_ms=500
-            ),
+            temperature=self.temperature,
+            condition_on_previous_text=self.condition_on_previous_text,
+            without_timestamps=True,
+            vad_filter=False,
         )
 
+        if use_vad:
+            # Drop the silences so the windows only hold speech
+            audio_data = np.concatenate(
+                [audio_data[slice(c["start"], c["end"])] for c in speech]
+            )
+
+        if use_vad and duration > 30:
+            # Several windows of speech: pack the VAD chunks into <=30s clips
+            # of one batched decode
+            segments, info = self.batched_model.transcribe(
+                audio_data,
+                batch_size=self.BATCH_SIZE,
+                clip_timestamps=pack_clip_windows(speech),
+                **options,
+            )
+        else:
+            segments, info = self.model.transcribe(audio_data, **options)
+
         # Combine all segments
         transcription = " ".join([segment.text.strip() for segment in segments])
 
-        detected_lang = info.language
-        confidence = info.language_probability
-
-        print(f"🎤 Detected: {detected_lang} ({confidence:.1%} confidence)")
+        logger.debug(
+            "Detected: %s (%.1f%% confidence)",
+            info.language,
+            info.language_probability * 100,
+        )
 
         return transcription.strip()
 
+    def warmup(self) -> None:
+        """
+        Run one throwaway transcription so the first real one starts warm.
+
+        CTranslate2 allocates its workspace and Silero VAD loads on first use;
+        doing that here (e.g. in a loader thread) keeps it off the first
+        recording's latency.
+        """
+        silence = np.zeros(16000, dtype=np.float32)
+        self._speech_timestamps(silence)
+        self.transcribe(silence, use_vad=False)
+        logger.debug("Warm-up transcription done")
+
+    def has_speech(self, audio_data: np.ndarray) -> bool:
+        """
+        Run Silero VAD over the audio to check for any speech.
+
+        Args:
+            audio_data: Audio numpy array (float32 in [-1, 1], or int16 PCM)
+
+        Returns:
+            True if at least one speech segment was detected
+        """
+        return bool(self._speech_timestamps(self._prepare_audio(audio_data)))
+
+    def find_final_boundary(
+        self, audio_data: np.ndarray, min_silence_s: float = 0.5
+    ) -> int:
+        """
+        Find how much of a still-growing recording can be transcribed already.
+
+        Uses Silero VAD so a chunk always ends after a finished speech segment
+        and never cuts through a word.
+
+        Args:
+            audio_data: Samples at 16000Hz captured so far (float32 or int16)
+            min_silence_s: Silence required after a segment before it is final
+
+        Returns:
+            Sample index up to which the audio is final (0 if none yet)
+        """
+        settled = len(audio_data) - int(min_silence_s * 16000)
+        if settled <= 0:
+            return 0
+
+        speech = self._speech_timestamps(self._prepare_audio(audio_data))
+        if not speech:
+            # Only silence so far: all of it up to the tail can be dropped
+            return settled
+
+        final_ends = [s["end"] for s in speech if s["end"] <= settled]
+        return final_ends[-1] if final_ends else 0
+
+    def _vad_options(self) -> VadOptions:
+        """VAD settings, with speech split into chunks of at most 30s."""
+        return VadOptions(**self.VAD_PARAMETERS, max_speech_duration_s=30)
+
+    def _speech_timestamps(self, audio_data: np.ndarray) -> List[Dict[str, int]]:
+        """Return the voiced regions of the audio as sample offsets."""
+        return get_speech_timestamps(audio_data, vad_options=self._vad_options())
+
     def transcribe_with_timestamps(
-        self, audio_data: np.ndarray, use_vad: bool = True
-    ) -> List[Dict[str, any]]:
+        self,
+        audio_data: np.ndarray,
+        use_vad: bool = True,
+        word_timestamps: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Transcribe with word-level timestamps.
+        Transcribe with segment-level and optionally word-level timestamps.
 
         Args:
             audio_data: Audio numpy array
             use_vad: Enable VAD filtering
+            word_timestamps: Also align and return individual words (costs an
+                extra alignment pass)
 
         Returns:
-            List of segments with start, end times and text
+            Iterator of segments with start, end times and text, yielded as
+            they are decoded
         """
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
-
-        if np.abs(audio_data).max() > 1.0:
-            audio_data = audio_data / np.abs(audio_data).max()
+        audio_data = self._prepare_audio(audio_data)
 
         segments, _ = self.model.transcribe(
-            audio_data, language=self.language, word_timestamps=True, vad_filter=use_vad
+            audio_data,
+            language=self.language,
+            word_timestamps=word_timestamps,
+            vad_filter=use_vad,
+            vad_parameters=self.VAD_PARAMETERS,
+            beam_size=self.beam_size,
+            best_of=self.beam_size,
+            temperature=self.temperature,
+            condition_on_previous_text=self.condition_on_previous_text,
         )
 
-        result = []
         for segment in segments:
-            result.append(
-                {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip(),
-                    "words": [
-                        {
-                            "word": word.word,
-                            "start": word.start,
-                            "end": word.end,
-                            "probability": word.probability,
-                        }
-                        for word in (segment.words or [])
-                    ],
-                }
-            )
-
-        return result
+            result = {
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text.strip(),
+            }
+            if word_timestamps:
+                result["words"] = [
+                    {
+                        "word": word.word,
+                        "start": word.start,
+                        "end": word.end,
+                        "probability": word.probability,
+                    }
+                    for word in (segment.words or [])
+                ]
+            yield result
@@ -6,14 +6,71 @@ AI-powered audio recording with transcription and refinement
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import threading
-import json
+import os
+import queue
 from pathlib import Path
 from datetime import datetime
 
 from utils.audio_handler import AudioHandler
+from utils.history_io import dumps_line, loads
 from utils.ai_engine import AIEngine
 from utils.refiner import Refiner
 
+# History writer: fsync after this many entries, or once the queue is idle
+HISTORY_FSYNC_EVERY = 16
+HISTORY_FSYNC_IDLE = 1.0  # seconds
+
+
+class RecordWorker(threading.Thread):
+    """Record, transcribe and refine one take off the Tk thread.
+
+    Progress goes onto a queue as ("status" | "transcription" | "refined", text)
+    events, and a <<RecordUpdate>> virtual event tells the GUI to drain it.
+    """
+
+    def __init__(self, gui):
+        super().__init__(daemon=True)
+        self.gui = gui
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop posting updates, e.g. because the window is closing"""
+        self.cancelled.set()
+
+    def post(self, kind, text):
+        """Queue an update for the GUI thread and wake it"""
+        if self.cancelled.is_set():
+            return
+        self.events.put((kind, text))
+        self.gui.root.event_generate("<<RecordUpdate>>", when="tail")
+
+    def run(self):
+        """Record audio and process it"""
+        # Record audio with VAD
+        audio_data = self.gui.audio_handler.record_with_vad()
+
+        if self.gui.is_recording or self.cancelled.is_set():
+            return
+
+        # Recording was stopped
+        self.post("status", "Processing...")
+
+        # Transcribe with Faster-Whisper
+        transcription = self.gui.ai_engine.transcribe(audio_data)
+        self.post("transcription", transcription)
+        if self.cancelled.is_set():
+            return
+
+        # Refine the text
+        refined = self.gui.refiner.refine_text(transcription)
+        self.post("refined", refined)
+
+        # Save to history
+        self.gui.save_to_history(transcription, refined)
+
+        self.post("status", "Ready to record")
+
 
 class ZukuriFlowGUI:
     def __init__(self, root):
@@ -28,11 +85,19 @@ class ZukuriFlowGUI:
 
         # State
         self.is_recording = False
+        self.worker = None
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
-        self.history_file = self.output_dir / "history.json"
+        self.history_file = self.output_dir / "history.jsonl"
+        self.migrate_history(self.output_dir / "history.json")
+
+        # History is appended by a background writer so recording never waits on disk
+        self._hist_q = queue.Queue()
+        threading.Thread(target=self._history_writer, daemon=True).start()
 
         self.setup_ui()
+        self.root.bind("<<RecordUpdate>>", self.on_record_update)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.load_history()
 
     def setup_ui(self):
@@ -60,7 +125,13 @@ class ZukuriFlowGUI:
             pady=(20, 5)
         )
         self.transcription_text = scrolledtext.ScrolledText(
-            self.root, height=10, width=90, wrap=tk.WORD, font=("Arial", 10)
+            self.root,
+            height=10,
+            width=90,
+            wrap=tk.WORD,
+            font=("Arial", 10),
+            undo=False,
+            autoseparators=False,
         )
         self.transcription_text.pack(padx=10, pady=5)
 
@@ -69,7 +140,13 @@ class ZukuriFlowGUI:
             pady=(10, 5)
         )
         self.refined_text = scrolledtext.ScrolledText(
-            self.root, height=10, width=90, wrap=tk.WORD, font=("Arial", 10)
+            self.root,
+            height=10,
+            width=90,
+            wrap=tk.WORD,
+            font=("Arial", 10),
+            undo=False,
+            autoseparators=False,
         )
         self.refined_text.pack(padx=10, pady=5)
 
@@ -89,7 +166,8 @@ class ZukuriFlowGUI:
         self.refined_text.delete(1.0, tk.END)
 
         # Start recording in a separate thread
-        threading.Thread(target=self.record_audio, daemon=True).start()
+        self.worker = RecordWorker(self)
+        self.worker.start()
 
     def stop_recording(self):
         """Stop audio recording"""
@@ -97,71 +175,128 @@ class ZukuriFlowGUI:
         self.record_btn.config(text="Start Recording")
         self.status_label.config(text="Processing audio...")
 
-    def record_audio(self):
-        """Record audio and process it"""
-        # Record audio with VAD
-        audio_data = self.audio_handler.record_with_vad()
-
-        if not self.is_recording:
-            # Recording was stopped
-            self.root.after(0, lambda: self.status_label.config(text="Processing..."))
-
-            # Transcribe with Faster-Whisper
-            transcription = self.ai_engine.transcribe(audio_data)
-
-            # Update UI with transcription
-            self.root.after(0, lambda: self.update_transcription(transcription))
-
-            # Refine the text
-            refined = self.refiner.refine_text(transcription)
-
-            # Update UI with refined text
-            self.root.after(0, lambda: self.update_refined(refined))
-
-            # Save to history
-            self.save_to_history(transcription, refined)
-
-            self.root.after(0, lambda: self.status_label.config(text="Ready to record"))
+    def on_record_update(self, event=None):
+        """Apply every update the record worker has queued"""
+        if self.worker is None:
+            return
+        while True:
+            try:
+                kind, text = self.worker.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "transcription":
+                self.update_transcription(text)
+            elif kind == "refined":
+                self.update_refined(text)
+            else:
+                self.status_label.config(text=text)
+
+    def on_close(self):
+        """Cancel any in-flight take, then close the window"""
+        if self.worker is not None:
+            self.worker.cancel()
+        self.root.destroy()
 
     def update_transcription(self, text):
         """Update transcription text box"""
-        self.transcription_text.delete(1.0, tk.END)
-        self.transcription_text.insert(1.0, text)
+        self.transcription_text.replace(1.0, tk.END, text)
 
     def update_refined(self, text):
         """Update refined text box"""
-        self.refined_text.delete(1.0, tk.END)
-        self.refined_text.insert(1.0, text)
+        self.refined_text.replace(1.0, tk.END, text)
 
     def save_to_history(self, transcription, refined):
-        """Save transcription to history.json"""
-        history = []
-        if self.history_file.exists():
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                history = json.load(f)
-
+        """Queue a transcription for the history writer (non-blocking)"""
         entry = {
             "timestamp": datetime.now().isoformat(),
             "transcription": transcription,
             "refined": refined,
         }
-        history.append(entry)
-
-        with open(self.history_file, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
+        self._hist_q.put(entry)
+
+    def _history_writer(self):
+        """Append queued entries to history.jsonl, one write() per batch"""
+        unsynced = 0
+        with open(self.history_file, "ab") as f:
+            while True:
+                try:
+                    batch = [self._hist_q.get(timeout=HISTORY_FSYNC_IDLE)]
+                except queue.Empty:
+                    if unsynced:
+                        os.fsync(f.fileno())
+                        unsynced = 0
+                    continue
+
+                # Drain whatever else arrived during rapid recordings
+                while True:
+                    try:
+                        batch.append(self._hist_q.get_nowait())
+                    except queue.Empty:
+                        break
+
+                try:
+                    f.write(b"".join(dumps_line(entry) for entry in batch))
+                    f.flush()
+                    unsynced += len(batch)
+                    if unsynced >= HISTORY_FSYNC_EVERY:
+                        os.fsync(f.fileno())
+                        unsynced = 0
+                except (OSError, TypeError, ValueError) as e:
+                    print(f"History write failed: {e}")
+                finally:
+                    for _ in batch:
+                        self._hist_q.task_done()
+
+    def flush_history(self):
+        """Block until every queued history entry has been written"""
+        self._hist_q.join()
+
+    def history_iter(self):
+        """Yield history entries one line at a time"""
+        if not self.history_file.exists():
+            return
+        with open(self.history_file, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+
+    def migrate_history(self, legacy_file):
+        """Convert an array-form history.json to history.jsonl on first launch
+
+        The legacy file is left in place; an unreadable one is not migrated.
+        """
+        if self.history_file.exists() or not legacy_file.exists():
+            return
+        try:
+            with open(legacy_file, "rb") as f:
+                content = f.read().strip()
+            history = loads(content) if content else []
+        except ValueError as e:  # json's and orjson's decode errors
+            print(f"Could not parse {legacy_file.name}: {e}. Not migrating.")
+            return
+        if not isinstance(history, list):
+            print(f"{legacy_file.name} is corrupted, not migrating")
+            return
+
+        tmp_file = self.history_file.with_suffix(".jsonl.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(b"".join(dumps_line(entry) for entry in history))
+        tmp_file.replace(self.history_file)
+        print(f"Migrated {len(history)} history entries to {self.history_file.name}")
 
     def load_history(self):
-        """Load history on startup"""
+        """Count history entries on startup without parsing them"""
         if self.history_file.exists():
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                history = json.load(f)
-                print(f"Loaded {len(history)} history entries")
+            with open(self.history_file, "rb") as f:
+                count = sum(1 for line in f if line.strip())
+            print(f"Loaded {count} history entries")
 
 
 def main():
     root = tk.Tk()
-    ZukuriFlowGUI(root)  # noqa: F841
+    app = ZukuriFlowGUI(root)
     root.mainloop()
+    app.flush_history()
 
 
 if __name__ == "__main__":
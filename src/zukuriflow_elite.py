@@ -4,14 +4,26 @@ Main application with PyQt6 floating button GUI
 """
 
 import os
-from typing import Optional
+from typing import List, NamedTuple, Optional, Set
 import sys
+import threading
 
 from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QPointF, QSize
-from PyQt6.QtGui import QPainter, QColor, QRadialGradient, QBrush, QPen, QMovie, QPixmap
+from PyQt6.QtCore import (
+    Qt,
+    QEvent,
+    QObject,
+    QRunnable,
+    QSize,
+    QThread,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QMovie, QPixmap
 
 from utils.whisper_engine import WhisperEngine
+from utils.cpu_caps import pick_compute_type
 from utils.audio_recorder import AudioRecorder, StreamingRecorder
 from utils.text_refiner import TextRefiner
 from utils.clipboard_manager import ClipboardManager
@@ -23,42 +35,171 @@ MIC_GIF_PATH = os.path.join(ASSETS_DIR, "mic_wave.gif")
 MIC_PNG_PATH = os.path.join(ASSETS_DIR, "mic_wave.png")
 
 
-class TranscriptionWorker(QThread):
+def create_whisper_engine() -> WhisperEngine:
+    """Build the Whisper engine used by the floating button."""
+    return WhisperEngine(
+        model_size="distil-small.en",
+        device="cpu",
+        compute_type=pick_compute_type(),
+        language="en",
+    )
+
+
+def _label_qss(color: str) -> str:
+    """Stylesheet for the status label in the given color."""
+    return f"""
+        QLabel {{
+            color: {color};
+            font-size: 10px;
+            font-family: 'Segoe UI', Arial, sans-serif;
+            background: transparent;
+        }}
     """
-    Worker thread for AI processing to prevent UI freezing.
+
+
+def _container_qss(border_color: Optional[str] = None) -> str:
+    """Stylesheet for the button container, outlined when a color is given."""
+    border = f"border: 2px solid {border_color};" if border_color else ""
+    return f"""
+        QWidget {{
+            background-color: #1a1a1a;
+            {border}
+            border-radius: 15px;
+        }}
+    """
+
+
+class ModelLoaderThread(QThread):
+    """
+    Loads the Whisper model off the GUI thread so the button paints at once.
+    """
+
+    ready = pyqtSignal(object)  # WhisperEngine
+    failed = pyqtSignal(str)
+
+    def run(self):
+        """Build and warm up the engine, then hand it back to the GUI thread."""
+        try:
+            engine = create_whisper_engine()
+            engine.warmup()
+            self.ready.emit(engine)
+        except Exception as e:
+            self.failed.emit(f"Model loading error: {str(e)}")
+
+
+class StreamingTranscriber(QThread):
+    """
+    Transcribes finished speech while the user is still recording.
+
+    Every CHUNK_SECONDS it takes the audio captured since the last cut,
+    transcribes everything up to the last finished speech segment and advances
+    the cut, so only the tail is left to transcribe when recording stops.
+    """
+
+    # Short polls keep the untranscribed tail small; a poll with no finished
+    # speech segment only costs a Silero VAD pass over the pending audio
+    CHUNK_SECONDS = 1.5
+
+    partial = pyqtSignal(str)
+
+    def __init__(self, whisper_engine: WhisperEngine, recorder: StreamingRecorder):
+        super().__init__()
+        self.whisper_engine = whisper_engine
+        self.recorder = recorder
+        self.offset = 0
+        self.parts: List[str] = []
+        self._stop = threading.Event()
+
+    def run(self):
+        """Transcribe finished speech segments until finish() is called."""
+        while not self._stop.wait(self.CHUNK_SECONDS):
+            try:
+                pending = self.recorder.peek_audio(self.offset)
+                cut = self.whisper_engine.find_final_boundary(pending)
+                if not cut:
+                    continue
+
+                text = self.whisper_engine.transcribe(pending[:cut], use_vad=True)
+                if text:
+                    self.parts.append(text)
+                    self.partial.emit(text)
+                self.offset += cut
+
+            except Exception as e:
+                # Whatever is left is transcribed as the tail on stop
+                print(f"⚠️ Streaming transcription failed: {e}")
+                return
+
+    def finish(self):
+        """Stop and wait for the in-flight chunk."""
+        self._stop.set()
+        self.wait()
+
+
+class TranscriptionResult(NamedTuple):
+    """Raw and refined text of one take."""
+
+    transcription: str
+    refined: str
+
+
+class TranscriptionSignals(QObject):
+    """
+    Signals for TranscriptionRunnable (a QRunnable cannot emit signals itself).
     """
 
-    finished = pyqtSignal(str, str)  # (transcription, refined)
+    # object, not (str, str): PyQt passes the Python reference across
+    # threads instead of converting both strings to QString and back
+    finished = pyqtSignal(object)  # TranscriptionResult
     error = pyqtSignal(str)
 
+
+class TranscriptionRunnable(QRunnable):
+    """
+    AI processing job run on the button's thread pool to prevent UI freezing.
+    """
+
     def __init__(
-        self, whisper_engine: WhisperEngine, text_refiner: TextRefiner, audio_data
+        self,
+        whisper_engine: WhisperEngine,
+        text_refiner: TextRefiner,
+        audio_data,
+        streamer: Optional[StreamingTranscriber] = None,
     ):
         super().__init__()
+        self.signals = TranscriptionSignals()
         self.whisper_engine = whisper_engine
         self.text_refiner = text_refiner
         self.audio_data = audio_data
+        # Transcribes finished speech during recording; only the tail is left
+        self.streamer = streamer
 
     def run(self):
         """Execute transcription and refinement in background thread."""
         try:
-            # Step 1: Transcribe with Whisper
-            transcription = self.whisper_engine.transcribe(
-                self.audio_data, use_vad=True
-            )
+            # Step 1: Transcribe the tail not yet covered by the stream
+            audio_data, parts = self.audio_data, []
+            if self.streamer is not None:
+                self.streamer.finish()
+                offset = self.streamer.offset
+                audio_data = audio_data[offset:]
+                parts = list(self.streamer.parts)
+            if len(audio_data):
+                parts.append(self.whisper_engine.transcribe(audio_data, use_vad=True))
+            transcription = " ".join(part for part in parts if part)
 
             if not transcription.strip():
-                self.error.emit("No speech detected")
+                self.signals.error.emit("No speech detected")
                 return
 
             # Step 2: Refine text
             refined = self.text_refiner.refine(transcription)
 
             # Emit results
-            self.finished.emit(transcription, refined)
+            self.signals.finished.emit(TranscriptionResult(transcription, refined))
 
         except Exception as e:
-            self.error.emit(f"Transcription error: {str(e)}")
+            self.signals.error.emit(f"Transcription error: {str(e)}")
 
 
 class FloatingButton(QWidget):
@@ -72,37 +213,97 @@ class FloatingButton(QWidget):
     COLOR_RECORDING = QColor(220, 50, 50)  # Red
     COLOR_PROCESSING = QColor(255, 215, 0)  # Gold
 
-    def __init__(self):
+    # Status label text and accent color per state
+    _STATUS_TEXT = {
+        "loading": "Loading model...",
+        "idle": "Click to record",
+        "recording": "Recording...",
+        "processing": "Processing...",
+    }
+    _STATUS_COLOR = {
+        "loading": "#555555",
+        "idle": "#888888",
+        "recording": "#ff4444",
+        "processing": "#ffd700",
+    }
+
+    # Stylesheets per state, built once from the tables above
+    _LABEL_QSS = {state: _label_qss(color) for state, color in _STATUS_COLOR.items()}
+    _CONTAINER_QSS = {
+        "idle": _container_qss(),
+        "recording": _container_qss(_STATUS_COLOR["recording"]),
+        "processing": _container_qss(_STATUS_COLOR["processing"]),
+    }
+
+    def __init__(self, whisper_engine: Optional[WhisperEngine] = None):
         super().__init__()
 
-        # Initialize AI components
+        # Initialize AI components; without a preloaded engine the model loads
+        # in the background and the button stays disabled until it is ready
         print("🚀 Initializing ZukuriFlow Elite...")
-        self.whisper_engine = WhisperEngine(
-            model_size="base", device="cpu", compute_type="int8", language="en"
+        self.whisper_engine = whisper_engine
+        self.model_loader: Optional[ModelLoaderThread] = None
+        # Float32 capture: PortAudio converts each block as it arrives, so the
+        # finished take (and every streaming peek) reaches Whisper without a
+        # conversion pass on the critical path
+        self.audio_recorder = AudioRecorder(
+            sample_rate=16000, channels=1, dtype="float32"
         )
-        self.audio_recorder = AudioRecorder(sample_rate=16000, channels=1)
         self.text_refiner = TextRefiner()
         self.clipboard_manager = ClipboardManager(output_dir="output")
 
         # State management
-        self.state = "idle"  # idle, recording, processing
+        # loading, idle, recording, processing
+        self.state = "idle" if whisper_engine else "loading"
         self.streaming_recorder: Optional[StreamingRecorder] = None
-        self.worker_thread: Optional[TranscriptionWorker] = None
+        self.streamer: Optional[StreamingTranscriber] = None
+        self.partial_text = ""
+
+        # Transcription jobs run on a persistent pool instead of a new QThread
+        # per take; the set keeps each job (and its signals) alive until done
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self.jobs: Set[TranscriptionRunnable] = set()
 
-        # Animation
-        self.pulse_value = 0.0
-        self.glow_value = 0.0
+        # Idle GIF, if one could be loaded
         self.movie = None
 
         # Setup UI
         self.setup_ui()
-        self.setup_animations()
 
         # For dragging
         self.drag_position = None
 
+        if self.whisper_engine is None:
+            self.update_status_appearance()
+            self.model_loader = ModelLoaderThread(self)
+            self.model_loader.ready.connect(self.on_model_ready)
+            self.model_loader.failed.connect(self.on_model_failed)
+            self.model_loader.finished.connect(self._on_model_loader_finished)
+            # Start once the event loop runs, i.e. after show() has painted
+            # the first frame, so model loading cannot delay it
+            QTimer.singleShot(0, self.model_loader.start)
+        else:
+            print("✅ ZukuriFlow Elite ready!")
+
+    def on_model_ready(self, whisper_engine: WhisperEngine):
+        """Enable recording once the background model load finishes."""
+        self.whisper_engine = whisper_engine
+        self.state = "idle"
+        self.update_status_appearance()
+        self._sync_animation()
         print("✅ ZukuriFlow Elite ready!")
 
+    def on_model_failed(self, error_message: str):
+        """Report a failed model load; the button stays disabled."""
+        print(f"❌ Error: {error_message}")
+        self.status_label.setText("Model failed to load")
+
+    def _on_model_loader_finished(self):
+        """Release the loader only once its thread has actually exited."""
+        self.model_loader.deleteLater()
+        self.model_loader = None
+
     def setup_ui(self):
         """Configure the floating button appearance."""
         # Frameless, transparent, always on top
@@ -186,6 +387,8 @@ class FloatingButton(QWidget):
             try:
                 self.movie = QMovie(MIC_GIF_PATH)
                 if self.movie.isValid():
+                    # Keep decoded, scaled frames so each loop only blits them
+                    self.movie.setCacheMode(QMovie.CacheMode.CacheAll)
                     self.movie.setScaledSize(QSize(75, 75))
                     self.gif_label.setMovie(self.movie)
                     self.movie.start()
@@ -245,61 +448,21 @@ class FloatingButton(QWidget):
 
     def update_status_appearance(self):
         """Update UI based on current state."""
-        if self.state == "processing":
-            self.status_label.setText("Processing...")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    color: #ffd700;
-                    font-size: 10px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    background: transparent;
-                }
-            """)
-            self.container.setStyleSheet("""
-                QWidget {
-                    background-color: #1a1a1a;
-                    border: 2px solid #ffd700;
-                    border-radius: 15px;
-                }
-            """)
-        elif self.state == "recording":
-            self.status_label.setText("Recording...")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    color: #ff4444;
-                    font-size: 10px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    background: transparent;
-                }
-            """)
-            self.container.setStyleSheet("""
-                QWidget {
-                    background-color: #1a1a1a;
-                    border: 2px solid #ff4444;
-                    border-radius: 15px;
-                }
-            """)
-        else:
-            self.status_label.setText("Click to record")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 10px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    background: transparent;
-                }
-            """)
-            self.container.setStyleSheet("""
-                QWidget {
-                    background-color: #1a1a1a;
-                    border-radius: 15px;
-                }
-            """)
+        state = self.state
+        self.status_label.setText(self._STATUS_TEXT[state])
+        self.status_label.setStyleSheet(self._LABEL_QSS[state])
+
+        # Loading leaves the container as set up; skip identical sheets,
+        # since every setStyleSheet() re-parses and re-polishes the widget
+        container_qss = self._CONTAINER_QSS.get(state)
+        if container_qss and self.container.styleSheet() != container_qss:
+            self.container.setStyleSheet(container_qss)
 
     def close_app(self):
         """Properly terminate the application."""
         print("\n👋 Closing ZukuriFlow Elite...")
         # Stop any ongoing recording
+        self._stop_streamer()
         if self.streaming_recorder:
             try:
                 self.streaming_recorder.stop()
@@ -325,6 +488,7 @@ class FloatingButton(QWidget):
         """Cancel current recording without processing."""
         if self.state == "recording":
             print("⏹️ Recording cancelled")
+            self._stop_streamer()
             if self.streaming_recorder:
                 try:
                     self.streaming_recorder.stop()
@@ -350,23 +514,33 @@ class FloatingButton(QWidget):
         elif action == quit_action:
             self.close_app()
 
-    def setup_animations(self):
-        """Setup timers for pulsing and glowing animations."""
-        # Pulse animation for recording state
-        self.pulse_timer = QTimer(self)
-        self.pulse_timer.timeout.connect(self.update_pulse)
-
-        # Glow animation for processing state
-        self.glow_timer = QTimer(self)
-        self.glow_timer.timeout.connect(self.update_glow)
-
-    def update_pulse(self):
-        """Update pulse animation value."""
-        self.update()
-
-    def update_glow(self):
-        """Update glow animation value."""
-        self.update()
+    def _sync_animation(self):
+        """
+        Play the GIF only while it can be seen and the button is idle.
+
+        When recording or processing the status colors show the state, and
+        skipping GIF frame decodes keeps the UI thread free to deliver the
+        transcription result.
+        """
+        visible = self.isVisible() and not self.isMinimized()
+        if self.movie is not None:
+            self.movie.setPaused(not (visible and self.state == "idle"))
+
+    def showEvent(self, event):
+        """Resume animations when the button is shown."""
+        super().showEvent(event)
+        self._sync_animation()
+
+    def hideEvent(self, event):
+        """Pause animations while the button is hidden."""
+        super().hideEvent(event)
+        self._sync_animation()
+
+    def changeEvent(self, event):
+        """Pause animations while the window is minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._sync_animation()
 
     def mousePressEvent(self, event):
         """Handle mouse press for dragging."""
@@ -394,26 +568,45 @@ class FloatingButton(QWidget):
             self.start_recording()
         elif self.state == "recording":
             self.stop_recording()
-        # Do nothing if processing
+        # Do nothing while the model loads or audio is processing
 
     def start_recording(self):
         """Start audio recording."""
         print("\n🔴 Starting recording...")
         self.state = "recording"
         self.update_status_appearance()
-        self.pulse_timer.start(50)  # 20 FPS for smooth animation
+        self._sync_animation()
 
         # Start streaming recorder
         self.streaming_recorder = self.audio_recorder.record_streaming()
         self.streaming_recorder.start()
 
+        # Transcribe finished sentences while the user keeps talking
+        self.streamer = StreamingTranscriber(
+            self.whisper_engine, self.streaming_recorder
+        )
+        self.partial_text = ""
+        self.streamer.partial.connect(self.on_partial_transcription)
+        self.streamer.start()
+
+    def _stop_streamer(self):
+        """Stop the streaming transcriber and drop its partial text."""
+        if self.streamer:
+            self.streamer.finish()
+            self.streamer = None
+
+    def on_partial_transcription(self, text: str):
+        """Preview text transcribed while still recording."""
+        print(f"📝 Partial: {text}")
+        self.partial_text = f"{self.partial_text} {text}".strip()
+        self.gif_label.setToolTip(self.partial_text)
+
     def stop_recording(self):
         """Stop recording and start processing."""
         print("⏹️ Stopping recording...")
         self.state = "processing"
         self.update_status_appearance()
-        self.pulse_timer.stop()
-        self.glow_timer.start(50)
+        self._sync_animation()
 
         # Stop streaming recorder and get audio
         if self.streaming_recorder:
@@ -423,6 +616,7 @@ class FloatingButton(QWidget):
             # Check if we got any audio
             if len(audio_data) == 0:
                 print("⚠️ No audio recorded")
+                self._stop_streamer()
                 self.reset_to_idle()
                 return
 
@@ -433,26 +627,33 @@ class FloatingButton(QWidget):
         """Process audio in background thread."""
         print("⚙️ Processing audio...")
 
-        # Create worker thread
-        self.worker_thread = TranscriptionWorker(
-            self.whisper_engine, self.text_refiner, audio_data
+        # The job waits for the streamer's in-flight chunk so the GUI thread
+        # never blocks on it
+        job = TranscriptionRunnable(
+            self.whisper_engine, self.text_refiner, audio_data, self.streamer
         )
+        self.streamer = None
 
         # Connect signals
-        self.worker_thread.finished.connect(self.on_transcription_finished)
-        self.worker_thread.error.connect(self.on_transcription_error)
+        job.signals.finished.connect(self.on_transcription_finished)
+        job.signals.error.connect(self.on_transcription_error)
+        job.signals.finished.connect(lambda *_: self.jobs.discard(job))
+        job.signals.error.connect(lambda *_: self.jobs.discard(job))
 
         # Start processing
-        self.worker_thread.start()
+        self.jobs.add(job)
+        self.pool.start(job)
 
-    def on_transcription_finished(self, transcription: str, refined: str):
+    def on_transcription_finished(self, result: TranscriptionResult):
         """Handle successful transcription."""
-        print(f"\n📝 Transcription: {transcription}")
-        print(f"✨ Refined: {refined}\n")
+        print(f"\n📝 Transcription: {result.transcription}")
+        print(f"✨ Refined: {result.refined}\n")
 
         # Save and paste
         self.clipboard_manager.copy_and_paste(
-            transcription=transcription, refined_text=refined, auto_paste=True
+            transcription=result.transcription,
+            refined_text=result.refined,
+            auto_paste=True,
         )
 
         self.reset_to_idle()
@@ -465,9 +666,9 @@ class FloatingButton(QWidget):
     def reset_to_idle(self):
         """Reset button to idle state."""
         self.state = "idle"
-        self.glow_timer.stop()
-        self.pulse_timer.stop()
-        self.worker_thread = None
+        self._sync_animation()
+        self.partial_text = ""
+        self.gif_label.setToolTip("")
         self.update_status_appearance()
         self.update()
         print("✅ Ready for next recording\n")
@@ -478,7 +679,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("ZukuriFlow Elite")
 
-    # Create and show floating button
+    # Show the floating button right away; it loads the model in the background
     button = FloatingButton()
     button.show()
 
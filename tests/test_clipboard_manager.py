@@ -0,0 +1,71 @@
+import json
+
+from src.utils.clipboard_manager import ClipboardManager
+
+
+def _entry(i):
+    return {"timestamp": f"2024-05-0{i}T10:00:00", "transcription": f"t{i}", "refined": f"r{i}", "metadata": {}}
+
+def _read_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+def _archived(output_dir):
+    entries = []
+    for path in sorted(output_dir.glob("history-*.jsonl")):
+        entries.extend(_read_lines(path))
+    return entries
+
+def test_rotation_archives_each_entry_once(tmp_path):
+    manager = ClipboardManager(str(tmp_path), max_entries=2)
+    for i in range(7):
+        manager.save_entry(f"t{i}", f"r{i}")
+    manager.flush()
+
+    assert [e["refined"] for e in _read_lines(tmp_path / "history.jsonl")] == ["r5", "r6"]
+    assert [e["refined"] for e in _archived(tmp_path)] == [f"r{i}" for i in range(5)]
+
+def test_unclean_exit_does_not_archive_twice(tmp_path):
+    manager = ClipboardManager(str(tmp_path), max_entries=2)
+    for i in range(3):
+        manager.save_entry(f"t{i}", f"r{i}")
+    # Written by the background writer, but never flushed
+    manager._append_pending()
+
+    reloaded = ClipboardManager(str(tmp_path), max_entries=2)
+    assert [e["refined"] for e in reloaded.get_history()] == ["r1", "r2"]
+    assert [e["refined"] for e in _archived(tmp_path)] == ["r0"]
+
+def test_legacy_history_is_migrated_and_kept(tmp_path):
+    legacy = tmp_path / "history.json"
+    legacy.write_text(json.dumps([_entry(i) for i in range(1, 6)]), encoding="utf-8")
+
+    manager = ClipboardManager(str(tmp_path), max_entries=3)
+
+    assert [e["refined"] for e in manager.get_history()] == ["r3", "r4", "r5"]
+    assert [e["refined"] for e in _read_lines(tmp_path / "history.jsonl")] == ["r3", "r4", "r5"]
+    assert [e["refined"] for e in _archived(tmp_path)] == ["r1", "r2"]
+    assert legacy.exists()
+
+def test_corrupt_legacy_history_starts_fresh(tmp_path):
+    (tmp_path / "history.json").write_text("[{not json", encoding="utf-8")
+
+    manager = ClipboardManager(str(tmp_path))
+
+    assert manager.get_history() == []
+    assert (tmp_path / "history.jsonl").read_bytes() == b""
+
+def test_failed_append_is_retried(tmp_path):
+    manager = ClipboardManager(str(tmp_path), max_entries=10)
+    history_file = tmp_path / "history.jsonl"
+    history_file.unlink()
+    history_file.mkdir()  # Any append now fails
+
+    manager.save_entry("t0", "r0")
+    manager.flush()
+    assert manager._writer.is_alive()
+
+    history_file.rmdir()
+    manager.save_entry("t1", "r1")
+    manager.flush()
+
+    assert [e["refined"] for e in _read_lines(history_file)] == ["r0", "r1"]
@@ -38,3 +38,41 @@ def test_empty_input():
     refiner = TextRefiner()
     assert refiner.refine("") == ""
     assert refiner.refine("   ") == ""
+
+def test_multi_word_and_custom_jargon():
+    refiner = TextRefiner()
+    refiner.add_custom_jargon("zukuriflow", "ZukuriFlow")
+    input_text = "zukuriflow uses hugging face models"
+    expected = "ZukuriFlow uses Hugging Face models."
+    assert refiner.refine(input_text) == expected
+
+def test_sentence_start_contraction_and_dotted_jargon():
+    refiner = TextRefiner()
+    input_text = "we use nextjs. dont worry.its fine"
+    expected = "We use Next.js. Don't worry. It's fine."
+    assert refiner.refine(input_text) == expected
+
+def test_already_refined_text_unchanged():
+    refiner = TextRefiner()
+    text = "This is already clean. Nothing to fix here!"
+    assert refiner.refine(text) == text
+    assert refiner.refine(refiner.refine("its done. dont touch it")) == "It's done. Don't touch it."
+
+def test_custom_jargon_invalidates_refine_cache():
+    refiner = TextRefiner()
+    assert refiner.refine("deploy with terraform") == "Deploy with terraform."
+    refiner.add_custom_jargon("terraform", "Terraform")
+    assert refiner.refine("deploy with terraform") == "Deploy with Terraform."
+
+def test_jargon_keys_starting_with_punctuation():
+    refiner = TextRefiner({".net": ".NET"})
+    assert refiner.refine("i use .net daily") == "I use .NET daily."
+    refiner.add_custom_jargon("++", "plus plus")
+    assert refiner.refine("hello ++ there") == "Hello plus plus there."
+
+def test_legacy_refiner_api():
+    from src.utils.refiner import TextRefiner as LegacyRefiner
+    refiner = LegacyRefiner()
+    refiner.add_mapping("fastapi", "FastAPI")
+    assert refiner.technical_mappings["fastapi"] == "FastAPI"
+    assert refiner.refine("built with fastapi") == "Built with FastAPI."